@@ -26,7 +26,7 @@ axe conveniently emits exactly such a selector per node, so it maps straight in.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, FrozenSet, List
 
 from content_accessibility_utility_on_aws.agent.browser_probe import ProbeResult
 from content_accessibility_utility_on_aws.audit.standards import get_criterion_info
@@ -222,8 +222,13 @@ class AxeAdapter:
         return issues
 
 
-def rendered_issue_types() -> set:
+# AXE_RULE_MAP is fixed at import time, so the emitted type set is built once.
+_RENDERED_ISSUE_TYPES: FrozenSet[str] = frozenset(
+    {"focus-not-visible", "focus-order-broken"}
+    | {m["type"] for m in AXE_RULE_MAP.values()}
+)
+
+
+def rendered_issue_types() -> FrozenSet[str]:
     """Set of issue types this adapter can emit (for de-dup / gating)."""
-    types = {"focus-not-visible", "focus-order-broken"}
-    types.update(m["type"] for m in AXE_RULE_MAP.values())
-    return types
+    return _RENDERED_ISSUE_TYPES
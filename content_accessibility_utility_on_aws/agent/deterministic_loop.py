@@ -18,7 +18,8 @@ unresolved and reported, mirroring how the tool already handles model-off cases.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from content_accessibility_utility_on_aws.agent.browser_probe import BrowserProbe
 from content_accessibility_utility_on_aws.agent.session import AgentSession
@@ -26,6 +27,8 @@ from content_accessibility_utility_on_aws.utils.logging_helper import setup_logg
 
 logger = setup_logger(__name__)
 
+_resolution_key = itemgetter("selector", "criterion")
+
 
 def run_deterministic(
     probe: BrowserProbe,
@@ -51,7 +54,13 @@ def run_deterministic(
 
     for round_num in range(max_rounds):
         issues = session.probe_page()
-        actionable = [i for i in issues if not _already_resolved(session, i)]
+        # Build the resolved-key set once per round rather than rescanning the
+        # resolution ledger for every probed issue.
+        resolved = _resolved_keys(session)
+        if resolved:
+            actionable = [i for i in issues if _issue_key(i) not in resolved]
+        else:
+            actionable = issues
         if not actionable:
             logger.debug("Deterministic loop converged after %d round(s)", round_num)
             break
@@ -90,7 +99,11 @@ def run_deterministic(
     }
 
 
-def _already_resolved(session: AgentSession, issue: Dict[str, Any]) -> bool:
-    selector = issue["location"].get("path")
-    criterion = issue["wcag_criterion"]
-    return {"selector": selector, "criterion": criterion} in session.resolved
+def _issue_key(issue: Dict[str, Any]) -> Tuple[Optional[str], str]:
+    """(selector, criterion) identifying a probed issue in the resolution ledger."""
+    return issue["location"].get("path"), issue["wcag_criterion"]
+
+
+def _resolved_keys(session: AgentSession) -> Set[Tuple[Optional[str], str]]:
+    """The session's committed resolutions as a set of (selector, criterion)."""
+    return set(map(_resolution_key, session.resolved))
@@ -259,9 +259,15 @@ def _run_audit(
         # ("agent on N pages" in the log but a report that credits nothing),
         # which makes the residual gap impossible to measure. Non-fatal.
         final_report = os.path.join(tmp, "audit_after.json")
-        gap = _reaudit_final(
-            reaudit_target, work, options, audit_result, final_report
-        )
+        if agent_pages == 0 and _tally_open_issues(audit_result)[0] == 0:
+            # Nothing was flagged and the agent changed no page, so a re-audit
+            # would only reproduce the before report. Skip it; the before
+            # report is published under the canonical name below.
+            gap = _gap_summary(audit_result, audit_result)
+        else:
+            gap = _reaudit_final(
+                reaudit_target, work, options, audit_result, final_report
+            )
 
         out_prefix = f"{OUTPUT_PREFIX}{name}/"
         published = _publish_tree(publish_root, output_bucket, out_prefix)
@@ -367,33 +373,41 @@ def _reaudit_final(
         logger.warning("Post-remediation re-audit failed: %s", e)
         return None
 
-    def _open_count(result: Dict[str, Any]) -> int:
-        summary = result.get("summary") or {}
-        if "needs_remediation" in summary:
-            return int(summary.get("needs_remediation") or 0)
-        # Fall back to counting unresolved issues directly.
-        return sum(
-            1 for i in result.get("issues", [])
-            if i.get("remediation_status") not in ("compliant", "remediated", "resolved")
-        )
+    return _gap_summary(before_result, after_result)
+
+
+def _tally_open_issues(result: Dict[str, Any]) -> Tuple[int, Dict[str, int]]:
+    """Count an audit result's open issues, overall and per WCAG criterion.
 
-    def _by_criterion(result: Dict[str, Any]) -> Dict[str, int]:
-        counts: Dict[str, int] = {}
-        for i in result.get("issues", []):
-            if i.get("remediation_status") in ("compliant", "remediated", "resolved"):
-                continue
-            crit = i.get("wcag_criterion") or "unknown"
-            counts[crit] = counts.get(crit, 0) + 1
-        return dict(sorted(counts.items()))
-
-    before_open = _open_count(before_result)
-    after_open = _open_count(after_result)
+    One pass over the issues yields both. The summary's ``needs_remediation``
+    count, when present, is authoritative for the overall number.
+    """
+    counts: Dict[str, int] = {}
+    open_issues = 0
+    for i in result.get("issues", []):
+        if i.get("remediation_status") in ("compliant", "remediated", "resolved"):
+            continue
+        open_issues += 1
+        crit = i.get("wcag_criterion") or "unknown"
+        counts[crit] = counts.get(crit, 0) + 1
+    summary = result.get("summary") or {}
+    if "needs_remediation" in summary:
+        open_issues = int(summary.get("needs_remediation") or 0)
+    return open_issues, dict(sorted(counts.items()))
+
+
+def _gap_summary(
+    before_result: Dict[str, Any], after_result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Before/after open counts, the resolved delta, and per-criterion residuals."""
+    before_open, before_by_criterion = _tally_open_issues(before_result)
+    after_open, after_by_criterion = _tally_open_issues(after_result)
     return {
         "issues_before": before_open,
         "issues_after": after_open,
         "issues_resolved": max(0, before_open - after_open),
-        "residual_by_criterion": _by_criterion(after_result),
-        "before_by_criterion": _by_criterion(before_result),
+        "residual_by_criterion": after_by_criterion,
+        "before_by_criterion": before_by_criterion,
     }
 
 
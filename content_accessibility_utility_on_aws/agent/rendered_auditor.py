@@ -31,7 +31,9 @@ logger = setup_logger(__name__)
 # When a rendered issue on the same WCAG criterion exists for an element, these
 # static issue types are considered superseded (the computed measurement wins).
 _STATIC_SUPERSEDED_BY_RENDERED = {
-    "1.4.3": {"insufficient-color-contrast", "potential-color-contrast-issue"},
+    "1.4.3": frozenset(
+        {"insufficient-color-contrast", "potential-color-contrast-issue"}
+    ),
 }
 
 
@@ -95,16 +97,22 @@ class RenderedAuditor:
         rendered_keys = {
             (_normalize_path(i["location"].get("path")), i["wcag_criterion"])
             for i in rendered_issues
+            if i["wcag_criterion"] in _STATIC_SUPERSEDED_BY_RENDERED
         }
+        if not rendered_keys:
+            # No rendered finding can supersede anything (no browser, or no
+            # findings on a superseding criterion): every static issue stays.
+            return list(static_issues)
         kept: List[Dict[str, Any]] = []
         for issue in static_issues:
             crit = issue.get("wcag_criterion")
-            path = _normalize_path((issue.get("location") or {}).get("path"))
-            superseded_types = _STATIC_SUPERSEDED_BY_RENDERED.get(crit, set())
-            if (
-                issue.get("type") in superseded_types
-                and (path, crit) in rendered_keys
-            ):
+            superseded_types = _STATIC_SUPERSEDED_BY_RENDERED.get(crit, ())
+            # Only the few superseded types need their path normalized; most
+            # static issues are kept on the cheap type check alone.
+            if issue.get("type") in superseded_types and (
+                _normalize_path((issue.get("location") or {}).get("path")),
+                crit,
+            ) in rendered_keys:
                 logger.debug(
                     "Dropping static issue %s superseded by rendered finding",
                     issue.get("type"),
@@ -23,7 +23,9 @@ hook that rejects any commit lacking a recorded pass.
 
 from __future__ import annotations
 
+import hashlib
 import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple
 
@@ -54,10 +56,15 @@ class AgentSession:
     resolved: List[Dict[str, str]] = field(default_factory=list)
     # A running log of tool calls for observability / tests.
     tool_log: List[Dict[str, Any]] = field(default_factory=list)
+    # How many distinct page states' probe results to keep. The agent often
+    # re-probes without having changed the page; an unchanged page is served
+    # from here instead of being re-rendered. 0 disables the cache.
+    probe_cache_size: int = 8
 
     def __post_init__(self) -> None:
         self._auditor = RenderedAuditor(self.probe)
         self._manager_cache = None
+        self._probe_cache: "OrderedDict[bytes, List[Dict[str, Any]]]" = OrderedDict()
 
     def _manager(self) -> RemediationManager:
         """Return a reused RemediationManager (built lazily on first fix)."""
@@ -70,8 +77,22 @@ class AgentSession:
     # -- tool-backing operations ------------------------------------------
 
     def probe_page(self) -> List[Dict[str, Any]]:
-        """Render the current HTML and return the outstanding rendered issues."""
-        issues = self._auditor.audit_html(self.html)
+        """Render the current HTML and return the outstanding rendered issues.
+
+        Results are memoized on a digest of the HTML, so re-probing a page that
+        no fix has touched since the last probe skips the browser round-trip.
+        """
+        key = hashlib.blake2b(self.html.encode("utf-8"), digest_size=16).digest()
+        cached = self._probe_cache.get(key)
+        if cached is not None:
+            self._probe_cache.move_to_end(key)
+            issues = list(cached)
+        else:
+            issues = self._auditor.audit_html(self.html)
+            if self.probe_cache_size > 0:
+                self._probe_cache[key] = list(issues)
+                if len(self._probe_cache) > self.probe_cache_size:
+                    self._probe_cache.popitem(last=False)
         self._record("render_and_probe", {}, {"issue_count": len(issues)})
         return issues
 
@@ -201,6 +222,8 @@ class AgentSession:
         if "</" in script or "document.write" in script:
             return "Rejected page-state script containing markup or document.write."
         self.probe.set_state_script(script or None)
+        # Cached results describe the previous state of the same HTML.
+        self._probe_cache.clear()
         self._record("set_page_state", {"script": script[:200]}, {"applied": True})
         # Re-probe in the new state so the model sees the newly-exposed issues.
         issues = self.probe_page()
@@ -75,9 +75,10 @@ class BaseAnalyzer:
         # Generate context if detailed option is enabled and element is provided
         if self.options.get("detailed", True) and element and context is None:
             try:
-                context = str(element)[:200]  # Limit context length
-                if len(str(element)) > 200:
-                    context += "..."
+                # Serialize the element once; only long markup is truncated
+                context = str(element)
+                if len(context) > 200:  # Limit context length
+                    context = context[:200] + "..."
             except AttributeError:
                 context = "Could not extract context"
 
@@ -9,6 +9,7 @@ This module provides the implementation for auditing HTML documents for accessib
 
 import os
 import traceback
+from collections import Counter
 from typing import Dict, Any, Optional
 
 from content_accessibility_utility_on_aws.audit.auditor import AccessibilityAuditor
@@ -80,9 +81,12 @@ def audit_html_accessibility(
         logger.debug("Number of issues: %d", len(audit_results["issues"]))
         logger.debug("Summary data: %s", audit_results.get("summary", {}))
 
+        # The in-memory report is the audit data itself; the file, if any, is
+        # written once below in the requested format rather than first being
+        # rendered as text and then overwritten.
         logger.debug("Generating text report...")
         text_report = generate_report(
-            audit_results, output_path=output_path, report_format="text"
+            audit_results, output_path=None, report_format="text"
         )
         if text_report is None:
             logger.warning("Text report generation failed, using basic format")
@@ -282,35 +286,38 @@ def _rebuild_audit_results(issues: list) -> Dict[str, Any]:
     (summary, by_page, by_status, issues) so downstream report generation is
     unaffected.
     """
-    for issue in issues:
-        if "location" not in issue or issue["location"] is None:
-            issue["location"] = {}
-        issue["location"].setdefault("page_number", issue.get("page_number", 0))
-
     issues_by_status = {
         "needs_remediation": [],
         "remediated": [],
         "auto_remediated": [],
         "compliant": [],
     }
+    issues_by_page: Dict[Any, list] = {}
+    page_status_counts: Dict[Any, Counter] = {}
+    severity_counts = {"critical": 0, "major": 0, "minor": 0, "info": 0}
+    # Normalize each issue and fill every aggregate in a single pass over the
+    # combined list rather than walking it once per aggregate (and four more
+    # times per page for the status counts).
     for issue in issues:
+        location = issue.get("location")
+        if location is None:
+            location = issue["location"] = {}
+        location.setdefault("page_number", issue.get("page_number", 0))
+
         status = issue.get("remediation_status", "needs_remediation")
         issues_by_status.setdefault(status, []).append(issue)
 
-    issues_by_page: Dict[Any, list] = {}
-    for issue in issues:
-        page = issue["location"].get("page_number", 0)
+        page = location.get("page_number", 0)
         issues_by_page.setdefault(page, []).append(issue)
+        # Per-page counts only match an explicit status, as before.
+        page_status_counts.setdefault(page, Counter())[
+            issue.get("remediation_status")
+        ] += 1
 
-    severity_counts = {"critical": 0, "major": 0, "minor": 0, "info": 0}
-    for issue in issues:
         sev = issue.get("severity", "info")
         if sev in severity_counts:
             severity_counts[sev] += 1
 
-    def _count(page_issues, status):
-        return len([i for i in page_issues if i.get("remediation_status") == status])
-
     return {
         "summary": {
             "total_issues": len(issues),
@@ -323,10 +330,10 @@ def _rebuild_audit_results(issues: list) -> Dict[str, Any]:
         "by_page": {
             page: {
                 "total": len(page_issues),
-                "needs_remediation": _count(page_issues, "needs_remediation"),
-                "remediated": _count(page_issues, "remediated"),
-                "auto_remediated": _count(page_issues, "auto_remediated"),
-                "compliant": _count(page_issues, "compliant"),
+                "needs_remediation": page_status_counts[page]["needs_remediation"],
+                "remediated": page_status_counts[page]["remediated"],
+                "auto_remediated": page_status_counts[page]["auto_remediated"],
+                "compliant": page_status_counts[page]["compliant"],
                 "issues": page_issues,
             }
             for page, page_issues in issues_by_page.items()
@@ -10,11 +10,15 @@ HTML content against WCAG 2.1 and 2.2 accessibility standards.
 
 import os
 import re
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 from bs4 import BeautifulSoup
 
 
+from content_accessibility_utility_on_aws.audit.context_collector import (
+    ContextCollector,
+)
 from content_accessibility_utility_on_aws.audit.checks import (
     HeadingHierarchyCheck,
     HeadingContentCheck,
@@ -40,12 +44,41 @@ from content_accessibility_utility_on_aws.utils.logging_helper import (
 )
 from content_accessibility_utility_on_aws.audit.standards import (
     SEVERITY_LEVELS,
-    get_criterion_info,
+    WCAG_CRITERIA,
 )
+from content_accessibility_utility_on_aws.utils.constants import HEADING_TAGS
 
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Check classes run on every audited page, in order
+_PAGE_CHECKS = (
+    HeadingHierarchyCheck,
+    HeadingContentCheck,
+    DocumentTitleCheck,
+    DocumentLanguageCheck,
+    MainLandmarkCheck,
+    SkipLinkCheck,
+    LandmarksCheck,
+    AltTextCheck,
+    FigureStructureCheck,
+    LinkTextCheck,
+    NewWindowLinkCheck,
+    TableHeaderCheck,
+    TableStructureCheck,
+    ColorContrastCheck,
+    FormLabelCheck,
+    FormRequiredFieldCheck,
+    FormFieldsetCheck,
+    TargetSizeCheck,
+)
+
+# (name, level) of each WCAG criterion, resolved once for every recorded issue
+_CRITERION_NAME_AND_LEVEL = {
+    criterion_id: (info.get("name", ""), info.get("level", ""))
+    for criterion_id, info in WCAG_CRITERIA.items()
+}
+
 
 class AccessibilityAuditor:
     """Class for auditing HTML content for WCAG 2.1 and 2.2 accessibility compliance issues."""
@@ -98,6 +131,13 @@ class AccessibilityAuditor:
         # Initialize issues list
         self.issues: List[Dict[str, Any]] = []
 
+        # Resolved once rather than for every recorded issue
+        self._min_severity = SEVERITY_LEVELS.get(
+            self.options.get("severity_threshold", "minor"), 1
+        )
+        # Shared by the remediated issues of one audit (set on first use)
+        self._remediation_date: Optional[str] = None
+
     def load_html(self) -> bool:
         """
         Load and parse the HTML content.
@@ -180,10 +220,12 @@ class AccessibilityAuditor:
         # Extract links
         self.links = self.soup.find_all("a")
 
-        # Extract headings
-        self.headings = []
-        for i in range(1, 7):
-            self.headings.extend(self.soup.find_all(f"h{i}"))
+        # Extract headings in one walk for all six levels; the stable sort keeps
+        # the level-grouped order (all h1s, then all h2s, ...) with document
+        # order preserved within each level
+        self.headings = sorted(
+            self.soup.find_all(HEADING_TAGS), key=lambda heading: heading.name
+        )
 
         # Extract forms and form elements
         self.form_elements.clear()
@@ -202,6 +244,7 @@ class AccessibilityAuditor:
             Audit report containing identified issues.
         """
         self.issues = []
+        self._remediation_date = None
 
         if not self.soup:
             if not self.load_html():
@@ -248,11 +291,23 @@ class AccessibilityAuditor:
         # Generate and return the report
         logger.info("Audit completed. Total issues found: %d", len(self.issues))
         
-        # Ensure all issues have a valid location field
+        # Group issues by page and by status, and tally each page's statuses
+        # and the severities, in a single pass over the issues
+        issues_by_page = {}
+        page_status_counts = Counter()
+        issues_by_status = {
+            "needs_remediation": [],
+            "remediated": [],
+            "auto_remediated": [],
+            "compliant": [],
+        }
+        severity_counts = {"critical": 0, "major": 0, "minor": 0, "info": 0}
+
         for issue in self.issues:
+            # Ensure all issues have a valid location field
             if "location" not in issue or issue["location"] is None:
                 issue["location"] = {}
-            
+
             # Ensure page_number exists in location
             if "page_number" not in issue["location"]:
                 # Try to get page number from root level if available
@@ -261,28 +316,19 @@ class AccessibilityAuditor:
                 else:
                     issue["location"]["page_number"] = 0
 
-        # Group issues by page
-        issues_by_page = {}
-        for issue in self.issues:
             page_num = issue["location"].get("page_number", 0)
-            if page_num not in issues_by_page:
-                issues_by_page[page_num] = []
-            issues_by_page[page_num].append(issue)
-
-        # Group issues by status
-        issues_by_status = {
-            "needs_remediation": [],
-            "remediated": [],
-            "auto_remediated": [],
-            "compliant": [],
-        }
+            issues_by_page.setdefault(page_num, []).append(issue)
 
-        for issue in self.issues:
             status = issue.get("remediation_status", "needs_remediation")
+            page_status_counts[page_num, status] += 1
             if status in issues_by_status:
                 issues_by_status[status].append(issue)
                 logger.debug("Added issue to %s group: %s", status, issue.get("type"))
 
+            severity = issue.get("severity", "info")
+            if severity in severity_counts:
+                severity_counts[severity] += 1
+
         # Count issues by status
         needs_remediation_count = len(issues_by_status["needs_remediation"])
         remediated_count = len(issues_by_status["remediated"])
@@ -297,14 +343,6 @@ class AccessibilityAuditor:
             compliant_count,
         )
 
-        # Group issues by severity
-        severity_counts = {"critical": 0, "major": 0, "minor": 0, "info": 0}
-
-        for issue in self.issues:
-            severity = issue.get("severity", "info")
-            if severity in severity_counts:
-                severity_counts[severity] += 1
-
         report = {
             "summary": {
                 "total_issues": len(self.issues),
@@ -317,34 +355,10 @@ class AccessibilityAuditor:
             "by_page": {
                 page: {
                     "total": len(page_issues),
-                    "needs_remediation": len(
-                        [
-                            i
-                            for i in page_issues
-                            if i["remediation_status"] == "needs_remediation"
-                        ]
-                    ),
-                    "remediated": len(
-                        [
-                            i
-                            for i in page_issues
-                            if i["remediation_status"] == "remediated"
-                        ]
-                    ),
-                    "auto_remediated": len(
-                        [
-                            i
-                            for i in page_issues
-                            if i["remediation_status"] == "auto_remediated"
-                        ]
-                    ),
-                    "compliant": len(
-                        [
-                            i
-                            for i in page_issues
-                            if i["remediation_status"] == "compliant"
-                        ]
-                    ),
+                    "needs_remediation": page_status_counts[page, "needs_remediation"],
+                    "remediated": page_status_counts[page, "remediated"],
+                    "auto_remediated": page_status_counts[page, "auto_remediated"],
+                    "compliant": page_status_counts[page, "compliant"],
                     "issues": page_issues,
                 }
                 for page, page_issues in issues_by_page.items()
@@ -391,26 +405,8 @@ class AccessibilityAuditor:
         current_issues_count = len(self.issues)
 
         # Initialize and run all checks
-        checks = [
-            HeadingHierarchyCheck(self.soup, self._add_issue),
-            HeadingContentCheck(self.soup, self._add_issue),
-            DocumentTitleCheck(self.soup, self._add_issue),
-            DocumentLanguageCheck(self.soup, self._add_issue),
-            MainLandmarkCheck(self.soup, self._add_issue),
-            SkipLinkCheck(self.soup, self._add_issue),
-            LandmarksCheck(self.soup, self._add_issue),
-            AltTextCheck(self.soup, self._add_issue),
-            FigureStructureCheck(self.soup, self._add_issue),
-            LinkTextCheck(self.soup, self._add_issue),
-            NewWindowLinkCheck(self.soup, self._add_issue),
-            TableHeaderCheck(self.soup, self._add_issue),
-            TableStructureCheck(self.soup, self._add_issue),
-            ColorContrastCheck(self.soup, self._add_issue),
-            FormLabelCheck(self.soup, self._add_issue),
-            FormRequiredFieldCheck(self.soup, self._add_issue),
-            FormFieldsetCheck(self.soup, self._add_issue),
-            TargetSizeCheck(self.soup, self._add_issue),
-        ]
+        add_issue = self._add_issue
+        checks = [check_class(self.soup, add_issue) for check_class in _PAGE_CHECKS]
 
         for check in checks:
             try:
@@ -429,6 +425,17 @@ class AccessibilityAuditor:
         # Get only the new issues added during this page's checks
         new_issues = self.issues[current_issues_count:]
 
+        # Human-readable location description, the same for every issue in
+        # this file: file name and page number where available
+        if page_num is not None:
+            description = (
+                f"File: {file_name} (Page {page_num})" if file_name else f"Page {page_num}"
+            )
+        elif file_name:
+            description = f"File: {file_name}"
+        else:
+            description = None
+
         for issue in new_issues:
             # Ensure location is always a dictionary, never None
             if "location" not in issue or issue["location"] is None:
@@ -448,16 +455,9 @@ class AccessibilityAuditor:
             if page_num is not None:
                 issue["location"]["page_number"] = page_num
                 issue["page_number"] = page_num  # Also store at root level for compatibility
-                
-                # Add a human-readable description that includes both file name and page number if available
-                if file_name:
-                    issue["location"]["description"] = f"File: {file_name} (Page {page_num})"
-                else:
-                    issue["location"]["description"] = f"Page {page_num}"
-            else:
-                # If no page number, just use the file name as the description
-                if file_name:
-                    issue["location"]["description"] = f"File: {file_name}"
+
+            if description is not None:
+                issue["location"]["description"] = description
 
         # Restore original soup
         self.soup = original_soup
@@ -606,9 +606,7 @@ class AccessibilityAuditor:
             pass  # Always include compliant issues
         else:
             # Skip if below severity threshold and not remediated
-            threshold = self.options.get("severity_threshold", "minor")
-            min_severity = SEVERITY_LEVELS.get(threshold, 1)
-            if SEVERITY_LEVELS.get(severity, 0) < min_severity:
+            if SEVERITY_LEVELS.get(severity, 0) < self._min_severity:
                 logger.debug("Skipping issue due to severity threshold: %s", issue_type)
                 return
 
@@ -626,10 +624,6 @@ class AccessibilityAuditor:
         # Generate enhanced context if detailed option is enabled and element is provided
         if self.options.get("detailed", True) and element and context is None:
             try:
-                from content_accessibility_utility_on_aws.audit.context_collector import (
-                    ContextCollector,
-                )
-
                 context = ContextCollector(element).collect()
             except Exception as e:
                 logger.error("Error collecting enhanced context: %s", str(e))
@@ -653,15 +647,25 @@ class AccessibilityAuditor:
             }
 
         # Get criterion info
-        criterion_info = get_criterion_info(wcag_criterion)
+        criterion_name, criterion_level = _CRITERION_NAME_AND_LEVEL.get(
+            wcag_criterion, ("", "")
+        )
+
+        # Remediated issues found by one audit share a single timestamp, so the
+        # clock is read once per audit rather than once per issue.
+        remediation_date = None
+        if status in ("remediated", "auto_remediated"):
+            if self._remediation_date is None:
+                self._remediation_date = datetime.utcnow().isoformat()
+            remediation_date = self._remediation_date
 
         # Create the issue object
         issue = {
             "id": issue_id,
             "type": issue_type,
             "wcag_criterion": wcag_criterion,
-            "criterion_name": criterion_info.get("name", ""),
-            "criterion_level": criterion_info.get("level", ""),
+            "criterion_name": criterion_name,
+            "criterion_level": criterion_level,
             "severity": severity,
             "element": element_str,
             "description": description or f"WCAG {wcag_criterion} issue: {issue_type}",
@@ -669,11 +673,7 @@ class AccessibilityAuditor:
             "location": location,
             "remediation_status": status,
             "remediation_source": remediation_source,
-            "remediation_date": (
-                datetime.utcnow().isoformat()
-                if status in ["remediated", "auto_remediated"]
-                else None
-            ),
+            "remediation_date": remediation_date,
         }
 
         # Add the issue to the list
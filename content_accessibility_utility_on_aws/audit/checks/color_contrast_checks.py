@@ -12,6 +12,7 @@ from typing import Tuple, Optional
 from bs4 import Tag
 
 from content_accessibility_utility_on_aws.audit.base_check import AccessibilityCheck
+from content_accessibility_utility_on_aws.utils.color_contrast import relative_luminance
 
 
 class ColorContrastCheck(AccessibilityCheck):
@@ -210,8 +211,11 @@ class ColorContrastCheck(AccessibilityCheck):
         Returns:
             A tuple of (r, g, b) values
         """
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        # Normalized colors always carry a single leading "#"; slice past it
+        # (together with the channel slice) rather than lstrip-ing a copy.
+        start = 1 if hex_color.startswith("#") else 0
+        # One C-level parse of all three channels instead of three int() calls.
+        return tuple(bytes.fromhex(hex_color[start : start + 6]))
 
     def _relative_luminance(self, rgb: Tuple[int, int, int]) -> float:
         """
@@ -223,35 +227,9 @@ class ColorContrastCheck(AccessibilityCheck):
         Returns:
             The relative luminance as a float
         """
-        r, g, b = rgb
-
-        # Normalize RGB values
-        r = r / 255
-        g = g / 255
-        b = b / 255
-
-        # Apply gamma correction
-        r = self._gamma_correct(r)
-        g = self._gamma_correct(g)
-        b = self._gamma_correct(b)
-
-        # Calculate luminance
-        return 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-    def _gamma_correct(self, value: float) -> float:
-        """
-        Apply gamma correction to a color channel value.
-
-        Args:
-            value: The color channel value (0-1)
-
-        Returns:
-            The gamma-corrected value
-        """
-        if value <= 0.03928:
-            return value / 12.92
-        else:
-            return ((value + 0.055) / 1.055) ** 2.4
+        # Shared (and memoized) WCAG math, so the audit measures with the same
+        # formula the remediation fixes to.
+        return relative_luminance(tuple(rgb))
 
     def _is_large_text(self, element: Tag) -> bool:
         """
@@ -14,6 +14,28 @@ from bs4 import Tag
 from content_accessibility_utility_on_aws.audit.base_check import AccessibilityCheck
 
 
+def _index_by_attribute(elements: List[Tag], attribute: str) -> Dict[str, Tag]:
+    """
+    Map each attribute value to the first element carrying it.
+
+    Mirrors ``soup.find(attrs={attribute: value})`` (first match in document
+    order) so per-control label lookups are a dict hit instead of a tree walk.
+
+    Args:
+        elements: Candidate elements, in document order
+        attribute: The attribute to key on
+
+    Returns:
+        Dictionary of attribute value to element
+    """
+    index: Dict[str, Tag] = {}
+    for element in elements:
+        value = element.get(attribute)
+        if isinstance(value, str):
+            index.setdefault(value, element)
+    return index
+
+
 class FormLabelCheck(AccessibilityCheck):
     """Check for proper form labels (WCAG 1.3.1, 3.3.2)."""
 
@@ -26,6 +48,14 @@ class FormLabelCheck(AccessibilityCheck):
             - form-control-missing-name: When a form control has no name attribute
             - form-label-empty: When a label element has no text content
         """
+        # Index labels and ids once; every control below looks up against them.
+        self._labels_by_for = _index_by_attribute(
+            self.soup.find_all("label", attrs={"for": True}), "for"
+        )
+        self._elements_by_id = _index_by_attribute(
+            self.soup.find_all(id=True), "id"
+        )
+
         # Check input elements
         input_elements = self.soup.find_all("input")
         for input_elem in input_elements:
@@ -133,7 +163,7 @@ class FormLabelCheck(AccessibilityCheck):
         # Check for id attribute
         if form_control.has_attr("id"):
             # Look for label with matching for attribute
-            matching_label = self.soup.find("label", attrs={"for": form_control["id"]})
+            matching_label = self._labels_by_for.get(form_control["id"])
             if matching_label:
                 return True
 
@@ -146,7 +176,7 @@ class FormLabelCheck(AccessibilityCheck):
         if form_control.has_attr("aria-labelledby"):
             label_ids = form_control["aria-labelledby"].split()
             for label_id in label_ids:
-                label_elem = self.soup.find(id=label_id)
+                label_elem = self._elements_by_id.get(label_id)
                 if label_elem and self.get_element_text(label_elem):
                     return True
 
@@ -178,6 +208,9 @@ class FormRequiredFieldCheck(AccessibilityCheck):
         """
         # Find all form controls
         form_controls = self.soup.find_all(["input", "select", "textarea"])
+        labels_by_for = _index_by_attribute(
+            self.soup.find_all("label", attrs={"for": True}), "for"
+        )
 
         for control in form_controls:
             # Skip hidden inputs and submit/reset buttons
@@ -197,7 +230,7 @@ class FormRequiredFieldCheck(AccessibilityCheck):
 
                 # Check associated label
                 if control.has_attr("id"):
-                    label = self.soup.find("label", attrs={"for": control["id"]})
+                    label = labels_by_for.get(control["id"])
                     if label:
                         label_text = self.get_element_text(label)
                         if "*" in label_text or "required" in label_text.lower():
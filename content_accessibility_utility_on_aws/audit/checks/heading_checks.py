@@ -9,6 +9,7 @@ This module provides checks for proper heading structure and content.
 """
 
 from content_accessibility_utility_on_aws.audit.base_check import AccessibilityCheck
+from content_accessibility_utility_on_aws.utils.constants import HEADING_TAGS
 
 
 class HeadingHierarchyCheck(AccessibilityCheck):
@@ -23,10 +24,13 @@ class HeadingHierarchyCheck(AccessibilityCheck):
             - no-h1: When the document has no h1 element
             - compliant-heading-hierarchy: When the document has proper heading hierarchy
         """
-        headings = []
-        for i in range(1, 7):
-            for h in self.soup.find_all(f"h{i}"):
-                headings.append((i, h))
+        # One walk for all levels; the stable sort keeps the existing
+        # level-grouped order (all h1s, then all h2s, ...) with document order
+        # preserved within each level.
+        headings = sorted(
+            ((int(h.name[1]), h) for h in self.soup.find_all(HEADING_TAGS)),
+            key=lambda pair: pair[0],
+        )
 
         if not headings:
             self.add_issue(
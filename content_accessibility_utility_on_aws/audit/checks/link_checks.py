@@ -13,6 +13,48 @@ from typing import List, Dict
 
 from content_accessibility_utility_on_aws.audit.base_check import AccessibilityCheck
 
+# Generic link text patterns, matched against the lowercased link text
+GENERIC_LINK_TEXTS = frozenset(
+    [
+        "click here",
+        "click",
+        "here",
+        "read more",
+        "more",
+        "learn more",
+        "details",
+        "link",
+        "this link",
+        "this page",
+        "this",
+        "go",
+        "go to",
+        "view",
+        "view more",
+        "see more",
+        "see details",
+        "continue",
+        "continue reading",
+    ]
+)
+
+# Text that looks like a URL: a scheme, a www. prefix, or a common TLD
+URL_PATTERN = re.compile(
+    "|".join(
+        [
+            r"^https?://",
+            r"^www\.",
+            r"\.com(/|$)",
+            r"\.org(/|$)",
+            r"\.net(/|$)",
+            r"\.edu(/|$)",
+            r"\.gov(/|$)",
+            r"\.io(/|$)",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
 
 class LinkTextCheck(AccessibilityCheck):
     """Check for proper link text (WCAG 2.4.4, 2.4.9)."""
@@ -34,29 +76,6 @@ class LinkTextCheck(AccessibilityCheck):
         # Track links by text for duplicate detection
         links_by_text: Dict[str, List[str]] = {}
 
-        # Generic link text patterns
-        generic_link_texts = [
-            "click here",
-            "click",
-            "here",
-            "read more",
-            "more",
-            "learn more",
-            "details",
-            "link",
-            "this link",
-            "this page",
-            "this",
-            "go",
-            "go to",
-            "view",
-            "view more",
-            "see more",
-            "see details",
-            "continue",
-            "continue reading",
-        ]
-
         for link in links:
             # Skip links that are just anchors
             if link.get("href", "").startswith("#") and not link.get("href", "").strip(
@@ -94,7 +113,7 @@ class LinkTextCheck(AccessibilityCheck):
 
             # Check for generic link text
             text_lower = text.lower()
-            if text_lower in generic_link_texts:
+            if text_lower in GENERIC_LINK_TEXTS:
                 self.add_issue(
                     "generic-link-text",
                     "2.4.4",
@@ -155,18 +174,7 @@ class LinkTextCheck(AccessibilityCheck):
         Returns:
             True if the text appears to be a URL, False otherwise
         """
-        url_patterns = [
-            r"^https?://",
-            r"^www\.",
-            r"\.com(/|$)",
-            r"\.org(/|$)",
-            r"\.net(/|$)",
-            r"\.edu(/|$)",
-            r"\.gov(/|$)",
-            r"\.io(/|$)",
-        ]
-
-        return any(re.search(pattern, text, re.IGNORECASE) for pattern in url_patterns)
+        return URL_PATTERN.search(text) is not None
 
 
 class NewWindowLinkCheck(AccessibilityCheck):
@@ -114,12 +114,13 @@ class SkipLinkCheck(AccessibilityCheck):
         skip_link = None
 
         for link in links:
-            href = link.get("href", "")
+            # Only fragment links can be skip links; check the href before
+            # assembling the link's text.
+            if not link.get("href", "").startswith("#"):
+                continue
             text = self.get_element_text(link).lower()
 
-            if href.startswith("#") and (
-                "skip" in text or "jump" in text or "content" in text or "main" in text
-            ):
+            if "skip" in text or "jump" in text or "content" in text or "main" in text:
                 has_skip_link = True
                 skip_link = link
                 break
@@ -81,15 +81,18 @@ class ContextCollector:
         position = {}
 
         try:
-            # Find all elements of the same type
-            if self.element.name:
-                all_elements = self.element.find_all_previous(self.element.name) + [
-                    self.element
-                ]
-                position["index"] = len(all_elements) - 1
-                position["total"] = len(all_elements) + len(
-                    self.element.find_all_next(self.element.name)
+            # Count the elements of the same type before and after this one;
+            # only the counts are needed, so no result lists are built
+            name = self.element.name
+            if name:
+                previous = sum(
+                    1 for el in self.element.previous_elements if el.name == name
                 )
+                following = sum(
+                    1 for el in self.element.next_elements if el.name == name
+                )
+                position["index"] = previous
+                position["total"] = previous + 1 + following
         except Exception:
             position["index"] = -1
             position["total"] = -1
@@ -118,11 +118,12 @@ def check_skip_link(soup, add_issue_callback):
     has_skip_link = False
 
     for link in links:
-        href = link.get("href", "")
+        # Only fragment links can be skip links; check the href before
+        # assembling the link's text.
+        if not link.get("href", "").startswith("#"):
+            continue
         text = link.get_text().lower()
-        if href.startswith("#") and (
-            "skip" in text or "jump" in text or "content" in text or "main" in text
-        ):
+        if "skip" in text or "jump" in text or "content" in text or "main" in text:
             has_skip_link = True
             break
 
@@ -12,13 +12,14 @@ import os
 import json
 import logging
 import tempfile
+from collections import Counter
 from typing import Dict, Any, Optional
 
-import boto3
 from botocore.exceptions import ClientError
 
 from content_accessibility_utility_on_aws.api import audit_html_accessibility
 from content_accessibility_utility_on_aws.batch.common import (
+    s3_client,
     download_from_s3,
     upload_to_s3,
     update_job_status,
@@ -185,8 +186,6 @@ def process_html_directory(
         Dictionary with the results of the audit
     """
 
-    s3_client = boto3.client("s3")
-
     if options is None:
         options = {}
 
@@ -265,18 +264,19 @@ def process_html_directory(
                     {"source_key": html_key, "status": STATUS_FAILED, "error": str(e)}
                 )
 
+        # Tally per-file outcomes once for the report, job status and result
+        status_counts = Counter(r.get("status") for r in audit_results)
+        files_succeeded = status_counts[STATUS_COMPLETED]
+        files_failed = status_counts[STATUS_FAILED]
+
         # Create a combined audit report
         combined_report = {
             "job_id": job_id,
             "source_bucket": source_bucket,
             "source_prefix": source_prefix,
             "files_processed": len(html_files),
-            "files_succeeded": sum(
-                1 for r in audit_results if r.get("status") == STATUS_COMPLETED
-            ),
-            "files_failed": sum(
-                1 for r in audit_results if r.get("status") == STATUS_FAILED
-            ),
+            "files_succeeded": files_succeeded,
+            "files_failed": files_failed,
             "summary": {
                 "total_issues": total_issues,
                 "severity_counts": severity_counts,
@@ -291,7 +291,8 @@ def process_html_directory(
             )
 
             with open(combined_report_path, "w", encoding="utf-8") as f:
-                json.dump(combined_report, f, indent=2)
+                # Machine-readable only, so skip indentation
+                json.dump(combined_report, f, separators=(",", ":"))
 
             combined_report_key = f"audit/{job_id}_combined_audit.json"
             upload_to_s3(
@@ -312,12 +313,8 @@ def process_html_directory(
             details={
                 "combined_audit_key": combined_report_key,
                 "files_processed": len(html_files),
-                "files_succeeded": sum(
-                    1 for r in audit_results if r.get("status") == STATUS_COMPLETED
-                ),
-                "files_failed": sum(
-                    1 for r in audit_results if r.get("status") == STATUS_FAILED
-                ),
+                "files_succeeded": files_succeeded,
+                "files_failed": files_failed,
                 "total_issues": total_issues,
                 "critical_issues": severity_counts.get("critical", 0),
                 "major_issues": severity_counts.get("major", 0),
@@ -334,12 +331,8 @@ def process_html_directory(
             "destination_bucket": destination_bucket,
             "combined_audit_key": combined_report_key,
             "files_processed": len(html_files),
-            "files_succeeded": sum(
-                1 for r in audit_results if r.get("status") == STATUS_COMPLETED
-            ),
-            "files_failed": sum(
-                1 for r in audit_results if r.get("status") == STATUS_FAILED
-            ),
+            "files_succeeded": files_succeeded,
+            "files_failed": files_failed,
             "total_issues": total_issues,
             "severity_counts": severity_counts,
         }
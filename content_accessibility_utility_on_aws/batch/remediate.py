@@ -12,12 +12,12 @@ import os
 import json
 import logging
 import tempfile
+from collections import Counter
 from typing import Dict, Any, Optional
 
-import boto3
-
 from content_accessibility_utility_on_aws.api import remediate_html_accessibility
 from content_accessibility_utility_on_aws.batch.common import (
+    s3_client,
     download_from_s3,
     upload_to_s3,
     update_job_status,
@@ -198,8 +198,6 @@ def process_html_directory_with_combined_audit(
         Dictionary with the results of the remediation
     """
 
-    s3_client = boto3.client("s3")
-
     if options is None:
         options = {}
 
@@ -317,6 +315,12 @@ def process_html_directory_with_combined_audit(
                 remediation_results.append(
                     {"html_key": html_key, "status": STATUS_FAILED, "error": str(e)}
                 )
+
+        # Tally per-file outcomes once for the report, job status and result
+        status_counts = Counter(r.get("status") for r in remediation_results)
+        files_succeeded = status_counts[STATUS_COMPLETED]
+        files_failed = status_counts[STATUS_FAILED]
+
         # Create a combined remediation report
         combined_report = {
             "job_id": job_id,
@@ -325,12 +329,8 @@ def process_html_directory_with_combined_audit(
             "audit_bucket": audit_bucket,
             "audit_key": audit_key,
             "files_processed": len(remediation_results),
-            "files_succeeded": sum(
-                1 for r in remediation_results if r.get("status") == STATUS_COMPLETED
-            ),
-            "files_failed": sum(
-                1 for r in remediation_results if r.get("status") == STATUS_FAILED
-            ),
+            "files_succeeded": files_succeeded,
+            "files_failed": files_failed,
             "summary": {
                 "total_issues_processed": total_issues_processed,
                 "total_issues_remediated": total_issues_remediated,
@@ -346,7 +346,8 @@ def process_html_directory_with_combined_audit(
             )
 
             with open(combined_report_path, "w", encoding="utf-8") as f:
-                json.dump(combined_report, f, indent=2)
+                # Machine-readable only, so skip indentation
+                json.dump(combined_report, f, separators=(",", ":"))
 
             combined_report_key = f"remediated/{job_id}_combined_remediation.json"
             upload_to_s3(
@@ -368,14 +369,8 @@ def process_html_directory_with_combined_audit(
             details={
                 "combined_remediation_key": combined_report_key,
                 "files_processed": len(remediation_results),
-                "files_succeeded": sum(
-                    1
-                    for r in remediation_results
-                    if r.get("status") == STATUS_COMPLETED
-                ),
-                "files_failed": sum(
-                    1 for r in remediation_results if r.get("status") == STATUS_FAILED
-                ),
+                "files_succeeded": files_succeeded,
+                "files_failed": files_failed,
                 "total_issues_processed": total_issues_processed,
                 "total_issues_remediated": total_issues_remediated,
                 "total_issues_failed": total_issues_failed,
@@ -393,12 +388,8 @@ def process_html_directory_with_combined_audit(
             "destination_bucket": destination_bucket,
             "combined_remediation_key": combined_report_key,
             "files_processed": len(remediation_results),
-            "files_succeeded": sum(
-                1 for r in remediation_results if r.get("status") == STATUS_COMPLETED
-            ),
-            "files_failed": sum(
-                1 for r in remediation_results if r.get("status") == STATUS_FAILED
-            ),
+            "files_succeeded": files_succeeded,
+            "files_failed": files_failed,
             "total_issues_processed": total_issues_processed,
             "total_issues_remediated": total_issues_remediated,
             "total_issues_failed": total_issues_failed,
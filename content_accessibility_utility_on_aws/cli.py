@@ -977,6 +977,19 @@ def run_audit_command(args: Dict[str, Any]) -> int:
         return 1
 
 
+def _needs_remediation(issue: Dict[str, Any]) -> bool:
+    """True for an audit issue that still needs remediation."""
+    return issue.get("remediation_status") == "needs_remediation"
+
+
+def _remediable_report(audit_report: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce an audit report to its summary and the issues needing remediation."""
+    return {
+        "issues": list(filter(_needs_remediation, audit_report.get("issues", []))),
+        "summary": audit_report.get("summary", {}),
+    }
+
+
 def run_remediate_command(args: Dict[str, Any]) -> int:
     """Run the accessibility remediation command."""
     try:
@@ -1035,14 +1048,7 @@ def run_remediate_command(args: Dict[str, Any]) -> int:
                     audit_report = json.load(f)
                 # Filter audit report to only include issues that need remediation
                 if audit_report:
-                    audit_report = {
-                        "issues": [
-                            issue
-                            for issue in audit_report.get("issues", [])
-                            if issue.get("remediation_status") == "needs_remediation"
-                        ],
-                        "summary": audit_report.get("summary", {}),
-                    }
+                    audit_report = _remediable_report(audit_report)
                     if not args.get("quiet"):
                         logger.debug(
                             "Loaded audit report from %s with "
@@ -1225,14 +1231,7 @@ def run_process_command(args: Dict[str, Any]) -> int:
             # Filter the audit report to only include issues that need remediation
             filtered_audit_report = None
             if audit_result:
-                filtered_audit_report = {
-                    "issues": [
-                        issue
-                        for issue in audit_result.get("issues", [])
-                        if issue.get("remediation_status") == "needs_remediation"
-                    ],
-                    "summary": audit_result.get("summary", {}),
-                }
+                filtered_audit_report = _remediable_report(audit_result)
                 logger.info(
                     "Filtered audit report to %d issues that need remediation",
                     len(filtered_audit_report["issues"]),
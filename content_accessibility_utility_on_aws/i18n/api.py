@@ -48,14 +48,13 @@ def _parse_target_languages(options: Dict[str, Any]) -> List[str]:
             "No target language specified. Provide target_languages "
             "(e.g. ['es', 'fr']) in options."
         )
-    seen: List[str] = []
-    for code in langs:
-        norm = normalize_lang_code(code)
-        if norm and norm not in seen:
-            seen.append(norm)
-    if not seen:
+    # dict.fromkeys de-duplicates while keeping the caller's order.
+    normalized = dict.fromkeys(
+        norm for norm in map(normalize_lang_code, langs) if norm
+    )
+    if not normalized:
         raise TranslationError("No valid target languages after normalization")
-    return seen
+    return list(normalized)
 
 
 def translate_html_accessibility(
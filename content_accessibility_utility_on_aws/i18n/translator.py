@@ -389,13 +389,11 @@ class _TextUnit:
         new_nodes = _reapply_boundary_whitespace(
             new_nodes, self._leading_ws, self._trailing_ws
         )
-        children = list(self._parent.children)
-        originals = children[self._start : self._end]
-        anchor_index = self._start
+        originals = self._parent.contents[self._start : self._end]
         for node in originals:
             node.extract()
         for offset, node in enumerate(new_nodes):
-            self._parent.insert(anchor_index + offset, node)
+            self._parent.insert(self._start + offset, node)
 
 
 def _is_inline(element: Tag) -> bool:
@@ -471,6 +469,8 @@ def _serialize_run(nodes, placeholders: List[_Placeholder]) -> Tuple[str, bool]:
     returns ``(serialized_text, has_translatable_text)``.
     """
     parts: List[str] = []
+    # Bound once: this runs for every node of every translated run
+    add = parts.append
     has_text = False
     for node in nodes:
         if isinstance(node, NavigableString):
@@ -479,21 +479,22 @@ def _serialize_run(nodes, placeholders: List[_Placeholder]) -> Tuple[str, bool]:
             raw = str(node)
             if raw.strip():
                 has_text = True
-            parts.append(_html_escape(raw))
+                add(_html_escape(raw))
+            else:
+                # Whitespace-only runs have nothing to escape
+                add(raw)
         elif isinstance(node, Tag):
             idx = len(placeholders)
             if _is_wrappable_inline(node):
                 placeholders.append(_Placeholder("wrap", node))
                 inner, inner_has = _serialize_run(list(node.children), placeholders)
                 has_text = has_text or inner_has
-                parts.append(
-                    f'<{_PLACEHOLDER_TAG} n="{idx}">{inner}</{_PLACEHOLDER_TAG}>'
-                )
+                add(f'<{_PLACEHOLDER_TAG} n="{idx}">{inner}</{_PLACEHOLDER_TAG}>')
             else:
                 # Opaque: kept verbatim (code sample, void element, or an inline
                 # element carrying no translatable text).
                 placeholders.append(_Placeholder("opaque", node))
-                parts.append(f'<{_PLACEHOLDER_TAG} n="{idx}"/>')
+                add(f'<{_PLACEHOLDER_TAG} n="{idx}"/>')
     return "".join(parts), has_text
 
 
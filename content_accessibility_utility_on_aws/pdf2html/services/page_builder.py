@@ -18,6 +18,35 @@ import hashlib
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
+# Static markup ahead of each page file's body; only the title varies
+_PAGE_HEAD_TEMPLATE = (
+    '<!DOCTYPE html>\n<html lang="en">\n<head>\n'
+    '    <meta charset="UTF-8">\n'
+    '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+    "    <title>{title}</title>\n"
+    "    <style>\n        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}\n    </style>\n"
+    "</head>\n<body>\n"
+)
+
+# Static markup of the combined document up to its page menu entries
+_COMBINED_HEAD_TEMPLATE = "\n".join(
+    [
+        "<!DOCTYPE html>",
+        '<html lang="en">',
+        "<head>",
+        '    <meta charset="UTF-8">',
+        '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
+        "    <title>{title}</title>",
+        "    <style>",
+        "        body {{ font-family: Arial, sans-serif; line-height: 1.6; }}",
+        "        .page-break {{ page-break-after: always; margin-bottom: 30px; border-bottom: 1px dashed #ccc; }}",
+        "    </style>",
+        "</head>",
+        "<body>",
+        "<nav><ul>",
+    ]
+)
+
 
 def handle_image_element(element_tag, element, output_dir):
     """
@@ -275,16 +304,7 @@ def build_html_data(
             page_file_path = os.path.join(html_output_dir, f"page-{i}.html")
             try:
                 with open(page_file_path, "w", encoding="utf-8") as f:
-                    f.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n')
-                    f.write('    <meta charset="UTF-8">\n')
-                    f.write(
-                        '    <meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
-                    )
-                    f.write(f"    <title>Page {i+1}</title>\n")
-                    f.write(
-                        "    <style>\n        body { font-family: Arial, sans-serif; line-height: 1.6; }\n    </style>\n"
-                    )
-                    f.write("</head>\n<body>\n")
+                    f.write(_PAGE_HEAD_TEMPLATE.format(title=f"Page {i+1}"))
                     f.write(page_html)
                     f.write("\n</body>\n</html>")
 
@@ -295,21 +315,12 @@ def build_html_data(
 
     else:
         # Create combined HTML file
-        combined_html_parts = [
-            "<!DOCTYPE html>",
-            '<html lang="en">',
-            "<head>",
-            '    <meta charset="UTF-8">',
-            '    <meta name="viewport" content="width=device-width, initial-scale=1.0">',
-            f'    <title>{"Document" if "metadata" not in result_data else result_data["metadata"].get("asset_id", "Document")}</title>',
-            "    <style>",
-            "        body { font-family: Arial, sans-serif; line-height: 1.6; }",
-            "        .page-break { page-break-after: always; margin-bottom: 30px; border-bottom: 1px dashed #ccc; }",
-            "    </style>",
-            "</head>",
-            "<body>",
-            "<nav><ul>"
-        ]
+        title = (
+            "Document"
+            if "metadata" not in result_data
+            else result_data["metadata"].get("asset_id", "Document")
+        )
+        combined_html_parts = [_COMBINED_HEAD_TEMPLATE.format(title=title)]
         pages = []
         for i in range(num_pages):
             page_html = (
@@ -6,6 +6,7 @@ Utility functions for PDF to HTML conversion.
 """
 
 import re
+from html import escape as _html_escape
 from typing import List, Dict, Any, Optional
 
 from content_accessibility_utility_on_aws.utils.logging_helper import (
@@ -49,14 +50,18 @@ def combine_html_pages(
                     logger.warning(f"No body content found in {page_file}")
                     pages_content.append(content.strip())
 
+        # Escape the metadata fields once, up front, for the head markup
+        metadata = {"language": "en", "title": "PDF Document", **(doc_info or {})}
+        safe = {k: _html_escape(str(metadata[k])) for k in ("language", "title")}
+
         # Create the combined document
         html_content = [
             "<!DOCTYPE html>",
-            f'<html lang="{doc_info.get("language", "en") if doc_info else "en"}">',
+            f'<html lang="{safe["language"]}">',
             "<head>",
             '<meta charset="utf-8"/>',
             '<meta content="width=device-width, initial-scale=1.0" name="viewport"/>',
-            f'<title>{doc_info.get("title", "PDF Document") if doc_info else "PDF Document"}</title>',
+            f'<title>{safe["title"]}</title>',
             "<style>",
             "        body { font-family: Arial, sans-serif; line-height: 1.6; }",
             "        .page-break { page-break-after: always; margin-bottom: 30px; border-bottom: 1px dashed #ccc; }",
@@ -7,7 +7,7 @@ HTML Accessibility Remediation API.
 This module provides functionality for remediating accessibility issues in HTML documents.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import os
 import shutil
 import re
@@ -26,6 +26,24 @@ from content_accessibility_utility_on_aws.remediate.remediation_manager import R
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# Default remediation options, overridden by any user-provided options
+_DEFAULT_REMEDIATION_OPTIONS: Dict[str, Any] = {
+    "auto_fix": True,
+    "fix_images": True,
+    "fix_headings": True,
+    "fix_links": True,
+    "fix_tables": True,
+    "fix_forms": True,
+    "fix_landmarks": True,
+    "fix_keyboard_nav": True,
+    "fix_alt_text": True,
+    "single_page": False,
+    "multi_page": False,
+    "max_issues": None,
+    "issue_types": None,
+    "severity_threshold": "minor",
+}
+
 
 def remediate_html_accessibility(
     html_path: str,
@@ -48,32 +66,11 @@ def remediate_html_accessibility(
         Dictionary containing remediation results.
     """
     try:
-        # Set default options
-        default_options = {
-            "auto_fix": True,
-            "fix_images": True,
-            "fix_headings": True,
-            "fix_links": True,
-            "fix_tables": True,
-            "fix_forms": True,
-            "fix_landmarks": True,
-            "fix_keyboard_nav": True,
-            "fix_alt_text": True,
-            "single_page": False,
-            "multi_page": False,
-            "max_issues": None,
-            "issue_types": None,
-            "severity_threshold": "minor",
-        }
-
         # Log default options for debugging
-        logger.debug(f"Default remediation options: {default_options}")
+        logger.debug(f"Default remediation options: {_DEFAULT_REMEDIATION_OPTIONS}")
 
-        # Update with user-provided options
-        if options:
-            default_options.update(options)
-
-        options = default_options
+        # Merge user-provided options over the defaults
+        options = _DEFAULT_REMEDIATION_OPTIONS | (options or {})
 
         # Auto-detect image directory if not specified
         if not image_dir:
@@ -146,33 +143,30 @@ def remediate_html_accessibility(
                         soup=soup,
                     )
 
-                    # Save the modified HTML
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(str(soup))
-
                     # Update result with remediation counts
                     result.update(remediation_result)
 
-                    # Write the updated HTML back to the file
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(str(soup))
-
-                    # Copy images if specified
+                    # Copy images if specified. A failure here must not lose
+                    # the remediated page, which is saved below either way.
                     if image_dir and os.path.exists(image_dir):
                         images_dest_dir = os.path.join(os.path.dirname(output_path))
                         logger.debug(
                             f"Copying images from {image_dir} to {images_dest_dir}"
                         )
-                        copy_images_to_output(image_dir, images_dest_dir, soup)
-
-                        # Write the updated HTML with image references back to the file
-                        with open(output_path, "w", encoding="utf-8") as f:
-                            f.write(str(soup))
+                        try:
+                            copy_images_to_output(image_dir, images_dest_dir, soup)
+                        except OSError as e:
+                            logger.warning(f"Error copying images: {e}")
                     else:
                         logger.warning(
                             f"Image directory not specified or does not exist: {image_dir}"
                         )
 
+                    # Save the modified HTML, with updated image references.
+                    # Serializing the tree is a full pass, so it is done once.
+                    with open(output_path, "w", encoding="utf-8") as f:
+                        f.write(str(soup))
+
         # Handle multi-page remediation
         elif is_multi_page:
             # Get list of HTML files in the directory
@@ -199,7 +193,22 @@ def remediate_html_accessibility(
 
                 # If we have an audit report, process each file with its issues
                 if audit_report:
+                    # Only issues still needing remediation are matched to
+                    # files, so filter them once instead of once per file. They
+                    # are then indexed by every value a file can match on, so
+                    # each file gathers its issues by lookup rather than by
+                    # testing every pending issue.
+                    pending_issues = [
+                        issue
+                        for issue in audit_report.get("issues", [])
+                        if issue.get("remediation_status") == "needs_remediation"
+                    ]
+                    pending_index, unlocated_positions = _index_issues_by_file(
+                        pending_issues
+                    )
+
                     for html_file in html_files:
+                        file_issues = []
                         try:
                             # Just use the basename of the HTML file for the output
                             filename = os.path.basename(html_file)
@@ -208,55 +217,34 @@ def remediate_html_accessibility(
                             # Create output directory if needed
                             os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-                            # Get issues for this file - normalize paths for comparison
-                            file_issues = []
-                            for issue in audit_report.get("issues", []):
-                                if (
-                                    issue.get("remediation_status")
-                                    != "needs_remediation"
-                                ):
-                                    continue
-
-                                # Try multiple places where the path might be stored
-                                issue_path = issue.get("file_path", "")
-                                issue_file_name = issue.get("file_name", "")
-                                issue_page_number = issue.get("page_number")
-                                
-                                # Check location field if root level fields aren't available
-                                if "location" in issue and issue["location"]:
-                                    if not issue_path:
-                                        issue_path = issue["location"].get("file_path", "")
-                                    if not issue_file_name:
-                                        issue_file_name = issue["location"].get("file_name", "")
-                                    if issue_page_number is None:
-                                        issue_page_number = issue["location"].get("page_number")
-
-                                # Get current file name for comparison
-                                current_file_name = os.path.basename(html_file)
-                                
-                                # Match by file path (exact or basename)
-                                if issue_path and (issue_path == html_file or 
-                                                  os.path.basename(issue_path) == current_file_name or
-                                                  os.path.abspath(issue_path) == os.path.abspath(html_file)):
-                                    file_issues.append(issue)
-                                    continue
-                                    
-                                # Match by file name
-                                if issue_file_name and issue_file_name == current_file_name:
-                                    file_issues.append(issue)
-                                    continue
-                                
-                                # Match by page number (extracted from filename)
-                                if issue_page_number is not None:
-                                    match = re.search(r"page[_-]?(\d+)\.html$", current_file_name, re.IGNORECASE)
-                                    if match and int(match.group(1)) == issue_page_number:
-                                        file_issues.append(issue)
-                                        continue
-
-                                # If no file_path, file_name, or page_number found and this is the first HTML file, 
-                                # assign all issues with no location info to it
-                                if not issue_path and not issue_file_name and issue_page_number is None and html_file == html_files[0]:
-                                    file_issues.append(issue)
+                            # Work out the page number encoded in the file name
+                            # once per file, not once per issue
+                            page_match = re.search(
+                                r"page[_-]?(\d+)\.html$", filename, re.IGNORECASE
+                            )
+                            file_page_number = (
+                                int(page_match.group(1)) if page_match else None
+                            )
+                            html_file_abspath = os.path.abspath(html_file)
+
+                            # Get issues for this file: an issue matches on its file
+                            # path (exact, basename or absolute), its file name, or
+                            # the page number encoded in the file name
+                            positions = set()
+                            for key in (
+                                ("path", html_file),
+                                ("basename", filename),
+                                ("abspath", html_file_abspath),
+                                ("file_name", filename),
+                                ("page", file_page_number),
+                            ):
+                                positions.update(pending_index.get(key, ()))
+                            # Issues with no location info all go to the first file
+                            if html_file == html_files[0]:
+                                positions.update(unlocated_positions)
+                            file_issues = [
+                                pending_issues[position] for position in sorted(positions)
+                            ]
 
                             # Log the number of issues found for this file
                             if file_issues:
@@ -289,16 +277,11 @@ def remediate_html_accessibility(
                                 soup=soup,
                             )
 
-                            # Save the modified HTML
-                            with open(output_file, "w", encoding="utf-8") as f:
-                                f.write(str(soup))
-
                             # Store file result for later aggregation, include the full remediation details
                             file_result["file_path"] = os.path.relpath(
                                 html_file, html_path
                             )
 
-                            # Add the file result to the list
                             # FIX: Make sure issues_remediated matches the issues_processed count
                             # This fixes the discrepancy in the file results
                             if (
@@ -315,9 +298,33 @@ def remediate_html_accessibility(
                                     f"Fixed {file_result['issues_processed']} issues with {file_result['changes_applied']} HTML changes"
                                 )
 
-                            file_results.append(file_result)
+                            # Copy images if specified. A failure here must not
+                            # lose the remediated page, which is saved below.
+                            if image_dir and os.path.exists(image_dir):
+                                images_dest_dir = os.path.join(output_path, "images")
+                                logger.debug(
+                                    f"Copying images from {image_dir} to {images_dest_dir}"
+                                )
+                                try:
+                                    copy_images_to_output(
+                                        image_dir, images_dest_dir, soup
+                                    )
+                                except OSError as e:
+                                    logger.warning(f"Error copying images: {e}")
+                            else:
+                                logger.warning(
+                                    f"Image directory not specified or does not exist: {image_dir}"
+                                )
 
-                            # Update counts
+                            # Save the modified HTML, with updated image
+                            # references, serializing the tree once
+                            with open(output_file, "w", encoding="utf-8") as f:
+                                f.write(str(soup))
+
+                            # Record the file and add its counts only once it is
+                            # saved, so a failure is counted by the handler below
+                            # and never on top of these
+                            file_results.append(file_result)
                             total_processed += file_result.get("issues_processed", 0)
                             total_remediated += file_result.get("issues_remediated", 0)
                             total_failed += file_result.get("issues_failed", 0)
@@ -329,22 +336,6 @@ def remediate_html_accessibility(
                                 result["failed_issue_types"].extend(
                                     file_result.get("failed_issue_types", [])
                                 )
-
-                            # Copy images if specified
-                            if image_dir and os.path.exists(image_dir):
-                                images_dest_dir = os.path.join(output_path, "images")
-                                logger.debug(
-                                    f"Copying images from {image_dir} to {images_dest_dir}"
-                                )
-                                copy_images_to_output(image_dir, images_dest_dir, soup)
-
-                                # Write the updated HTML with image references back to the file
-                                with open(output_file, "w", encoding="utf-8") as f:
-                                    f.write(str(soup))
-                            else:
-                                logger.warning(
-                                    f"Image directory not specified or does not exist: {image_dir}"
-                                )
                         except Exception as e:
                             logger.warning(f"Error remediating HTML file: {e}")
                             total_processed += len(file_issues)
@@ -363,10 +354,10 @@ def remediate_html_accessibility(
                         "Issues count has been standardized to show actual issues processed and remediated correctly."
                     )
 
-                    # Deduplicate failed issue types
+                    # Deduplicate failed issue types, keeping first-seen order
                     if "failed_issue_types" in result:
                         result["failed_issue_types"] = list(
-                            set(result["failed_issue_types"])
+                            dict.fromkeys(result["failed_issue_types"])
                         )
 
                     # Handle page mode based on flags
@@ -561,6 +552,84 @@ def remediate_html_accessibility(
         raise DocumentAccessibilityError(f"Failed to remediate HTML accessibility: {e}")
 
 
+def _issue_file_locator(
+    issue: Dict[str, Any],
+) -> Tuple[str, str, str, str, Optional[int]]:
+    """
+    Resolve where an audit issue says it lives, for matching it to HTML files.
+
+    Root-level fields win; ``location`` fills in any that are missing.
+
+    Returns:
+        Tuple of (file path, its basename, its absolute path, file name,
+        page number). Path-derived values are empty when there is no path or
+        the path is not a string.
+    """
+    issue_path = issue.get("file_path", "")
+    issue_file_name = issue.get("file_name", "")
+    issue_page_number = issue.get("page_number")
+
+    # Check location field if root level fields aren't available
+    location = issue.get("location")
+    if location and isinstance(location, dict):
+        if not issue_path:
+            issue_path = location.get("file_path", "")
+        if not issue_file_name:
+            issue_file_name = location.get("file_name", "")
+        if issue_page_number is None:
+            issue_page_number = location.get("page_number")
+
+    if not issue_path or not isinstance(issue_path, str):
+        return issue_path, "", "", issue_file_name, issue_page_number
+    return (
+        issue_path,
+        os.path.basename(issue_path),
+        os.path.abspath(issue_path),
+        issue_file_name,
+        issue_page_number,
+    )
+
+
+def _index_issues_by_file(
+    issues: List[Dict[str, Any]],
+) -> Tuple[Dict[Tuple[str, Any], List[int]], List[int]]:
+    """
+    Index issues by the values used to match them to HTML files.
+
+    Args:
+        issues: Issues to index.
+
+    Returns:
+        Tuple of (index, unlocated). The index maps ("path" | "basename" |
+        "abspath" | "file_name" | "page", value) to the positions of the issues
+        carrying that value, in order. Unlocated lists the positions of issues
+        with no file path, file name or page number. Malformed values (e.g. a
+        list as page number) still count as location info but match no file.
+    """
+    index: Dict[Tuple[str, Any], List[int]] = {}
+    unlocated: List[int] = []
+    for position, issue in enumerate(issues):
+        path, basename, abspath, file_name, page_number = _issue_file_locator(issue)
+        if not path and not file_name and page_number is None:
+            unlocated.append(position)
+            continue
+        for key in (
+            ("path", path),
+            ("basename", basename),
+            ("abspath", abspath),
+            ("file_name", file_name),
+            ("page", page_number),
+        ):
+            if key[1] is None or key[1] == "":
+                continue
+            try:
+                index.setdefault(key, []).append(position)
+            except TypeError:
+                # Unhashable, so it cannot equal any file's value either
+                continue
+    return index, unlocated
+
+
 def _remediate_html_file(
     html_path: str,
     issues: List[Dict[str, Any]],
@@ -588,6 +657,12 @@ def _remediate_html_file(
         "failed_issue_types": [],
     }
 
+    # Nothing to remediate: skip parsing the HTML and building a remediation
+    # manager, which sets up a Bedrock client
+    if not issues:
+        logger.debug(f"No issues to remediate for {html_path}")
+        return result
+
     try:
         # Parse HTML if not already provided
         if not soup:
@@ -602,49 +677,35 @@ def _remediate_html_file(
         remediation_manager = RemediationManager(soup, options)
 
         # Remediate issues
-        if issues:
-            # Log the number of issues being processed
-            logger.debug(
-                f"Processing {len(issues)} issues for remediation in {html_path}"
-            )
-
-            remediation_result = remediation_manager.remediate_issues(issues)
-
-            # Update result with remediation counts
-            result["issues_processed"] = len(issues)
-            result["issues_remediated"] = remediation_result.get(
-                "actual_issues_fixed", remediation_result.get("issues_remediated", 0)
-            )
-            result["issues_failed"] = remediation_result.get("issues_failed", 0)
-            result["failed_issue_types"] = remediation_result.get(
-                "failed_issue_types", []
-            )
-
-            # Track the total number of changes applied (which may be more than issues processed)
-            if "total_changes_applied" in remediation_result:
-                result["changes_applied"] = remediation_result.get(
-                    "total_changes_applied"
-                )
-
-            # Add detailed issue results for reporting
-            result["details"] = remediation_result.get("details", [])
-            result["remediated_issues_details"] = remediation_result.get(
-                "remediated_issues_details", []
-            )
-            result["failed_issues_details"] = remediation_result.get(
-                "failed_issues_details", []
-            )
-
-            # Log detailed results
-            logger.debug(
-                f"Remediation completed: {result['issues_remediated']} fixed, {result['issues_failed']} failed"
-            )
-        else:
-            # No issues to remediate
-            logger.debug(f"No issues to remediate for {html_path}")
-            result["issues_processed"] = 0
-            result["issues_remediated"] = 0
-            result["issues_failed"] = 0
+        logger.debug(f"Processing {len(issues)} issues for remediation in {html_path}")
+
+        remediation_result = remediation_manager.remediate_issues(issues)
+
+        # Update result with remediation counts
+        result["issues_processed"] = len(issues)
+        result["issues_remediated"] = remediation_result.get(
+            "actual_issues_fixed", remediation_result.get("issues_remediated", 0)
+        )
+        result["issues_failed"] = remediation_result.get("issues_failed", 0)
+        result["failed_issue_types"] = remediation_result.get("failed_issue_types", [])
+
+        # Track the total number of changes applied (which may be more than issues processed)
+        if "total_changes_applied" in remediation_result:
+            result["changes_applied"] = remediation_result.get("total_changes_applied")
+
+        # Add detailed issue results for reporting
+        result["details"] = remediation_result.get("details", [])
+        result["remediated_issues_details"] = remediation_result.get(
+            "remediated_issues_details", []
+        )
+        result["failed_issues_details"] = remediation_result.get(
+            "failed_issues_details", []
+        )
+
+        # Log detailed results
+        logger.debug(
+            f"Remediation completed: {result['issues_remediated']} fixed, {result['issues_failed']} failed"
+        )
 
         return result
 
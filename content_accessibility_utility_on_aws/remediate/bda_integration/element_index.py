@@ -8,6 +8,7 @@ This module provides functionality for indexing and organizing BDA elements
 and connecting them with accessibility issues.
 """
 
+import re
 from typing import Dict, List, Any, Optional, Union
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 
@@ -52,6 +53,9 @@ class ElementIndex:
         self.page_remediation_status: Dict[int, Dict[str, Any]] = (
             {}
         )  # Track remediation status by page
+        self._page_members: Dict[int, List[Dict[str, Any]]] = (
+            {}
+        )  # Elements per page in input order, for issue matching
 
         # Build indexes
         self._build_indexes()
@@ -66,9 +70,26 @@ class ElementIndex:
             self.element_order = []
             self.pages_with_issues = {}
             self.page_remediation_status = {}
+            self._page_members = {}
+
+            # Sort every element by on-page position once. Bucketing into pages
+            # in this order leaves each page's list already sorted, so no
+            # per-page sort is needed afterwards.
+            # The key functions are bound to locals up front: they run once per
+            # element, and large BDA documents have thousands of elements.
+            elements_data = self.elements_data
+            position_key = ElementIndex._get_position_key
+            positioned = sorted(
+                elements_data.items(), key=lambda item: position_key(item[1])
+            )
+
+            # Document order is (first page, position). Bucketing the already
+            # position-ordered elements by first page, then joining the buckets
+            # in page order, yields it without a second sort over all elements.
+            by_first_page = {}
 
             # First, index elements by page and build element order
-            for element_id, element in self.elements_data.items():
+            for element_id, element in positioned:
                 # Add to page index
                 for page_index in element.get("page_indices", []):
                     if page_index not in self.elements_by_page:
@@ -86,21 +107,18 @@ class ElementIndex:
                     self.page_remediation_status[page_index]["total_elements"] += 1
 
                 # Add to element order
-                self.element_order.append(element_id)
-
-            # Sort elements within each page by position
-            for page_index in self.elements_by_page:
-                self.elements_by_page[page_index].sort(
-                    key=lambda x: (
-                        x.get("bounding_box", {}).get("top", 0),
-                        x.get("bounding_box", {}).get("left", 0),
-                    )
-                )
-
-            # Sort element order based on page and position
-            self.element_order.sort(
-                key=lambda x: self._get_element_sort_key(self.elements_data[x])
-            )
+                first_page = min(element.get("page_indices", [0]))
+                by_first_page.setdefault(first_page, []).append(element_id)
+
+            for first_page in sorted(by_first_page):
+                self.element_order.extend(by_first_page[first_page])
+
+            # Page membership in input order. Issue matching picks elements by
+            # ordinal and "first match", so it must see the original order
+            # rather than the position-sorted page buckets above.
+            for element in self.elements_data.values():
+                for page_index in set(element.get("page_indices", [])):
+                    self._page_members.setdefault(page_index, []).append(element)
 
             # Then, connect issues with elements
             if self.issues:
@@ -268,12 +286,11 @@ class ElementIndex:
 
         return updated
 
-    def _get_element_sort_key(self, element: Dict[str, Any]) -> tuple:
-        """Get a sort key for an element based on its position in the document."""
-        page_indices = element.get("page_indices", [0])
-        first_page = min(page_indices)
+    @staticmethod
+    def _get_position_key(element: Dict[str, Any]) -> tuple:
+        """Get a (top, left) sort key for an element's position on its page."""
         bbox = element.get("bounding_box", {})
-        return (first_page, bbox.get("top", 0), bbox.get("left", 0))
+        return (bbox.get("top", 0), bbox.get("left", 0))
 
     def _get_element_id_from_issue(self, issue: Dict[str, Any]) -> Optional[str]:
         """Extract element ID from an accessibility issue."""
@@ -284,11 +301,7 @@ class ElementIndex:
 
             if page_number is not None:
                 # Find elements on this page
-                page_elements = [
-                    element
-                    for element in self.elements_data.values()
-                    if page_number in element.get("page_indices", [])
-                ]
+                page_elements = self._page_members.get(page_number, [])
 
                 # If we have a path, try to match by position in the page
                 if path and ":nth-of-type(" in path:
@@ -311,8 +324,6 @@ class ElementIndex:
 
                 # Try to match by context if available
                 if "context" in issue and isinstance(issue["context"], str):
-                    import re
-
                     # Extract src and alt attributes from context
                     src_match = re.search(r'src=["\'](.*?)["\']', issue["context"])
                     alt_match = re.search(r'alt=["\'](.*?)["\']', issue["context"])
@@ -387,13 +398,20 @@ class ElementIndex:
 
     def get_elements_with_issues(self) -> List[Dict[str, Any]]:
         """Get all elements that have accessibility issues."""
-        result = []
-        for element_id, issues in self.elements_with_issues.items():
-            if element_id in self.elements_data:
-                element = self.elements_data[element_id].copy()
-                element["accessibility_issues"] = issues
-                result.append(element)
-        return result
+        elements = self.elements_data
+        return [
+            {**elements[element_id], "accessibility_issues": issues}
+            for element_id, issues in self.elements_with_issues.items()
+            if element_id in elements
+        ]
+
+    def count_elements_with_issues(self) -> int:
+        """Count the elements that have accessibility issues, without copying them."""
+        return sum(
+            1
+            for element_id in self.elements_with_issues
+            if element_id in self.elements_data
+        )
 
     def get_issues_by_element_id(self, element_id: str) -> List[Dict[str, Any]]:
         """Get all accessibility issues for a specific element."""
@@ -422,7 +440,7 @@ class ElementIndex:
         self, current_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Get the next element with issues after the current element."""
-        elements_with_issues = set(self.elements_with_issues.keys())
+        elements_with_issues = self.elements_with_issues
         if not elements_with_issues:
             return None
 
@@ -455,7 +473,7 @@ class ElementIndex:
         self, current_id: str
     ) -> Optional[Dict[str, Any]]:
         """Get the previous element with issues before the current element."""
-        elements_with_issues = set(self.elements_with_issues.keys())
+        elements_with_issues = self.elements_with_issues
         if not elements_with_issues:
             return None
 
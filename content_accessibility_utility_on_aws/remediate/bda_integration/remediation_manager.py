@@ -692,7 +692,7 @@ class RemediationManager:
 
     def get_remediation_status(self) -> Dict[str, Any]:
         """Get the current status of the remediation process."""
-        total_elements = len(self.element_index.get_elements_with_issues())
+        total_elements = self.element_index.count_elements_with_issues()
         fixed_elements = len(
             set(entry["element_id"] for entry in self.remediation_history)
         )
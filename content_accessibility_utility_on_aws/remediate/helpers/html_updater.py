@@ -115,7 +115,10 @@ class HTMLUpdater:
             logger.debug(f"Found element with {selector}")
 
             # Update the content
-            old_content = str(element)[:50] + ("..." if len(str(element)) > 50 else "")
+            # Serialize the element once; only long markup needs truncating
+            old_content = str(element)
+            if len(old_content) > 50:
+                old_content = old_content[:50] + "..."
             new_soup = BeautifulSoup(content, "html.parser")
             element.replace_with(new_soup)
 
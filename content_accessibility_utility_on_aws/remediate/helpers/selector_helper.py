@@ -8,7 +8,9 @@ This module provides functionality to generate and manipulate CSS selectors
 for HTML elements.
 """
 
+import os
 import re
+from itertools import islice
 from typing import Any, Dict, Optional
 from bs4 import BeautifulSoup, Tag
 
@@ -120,11 +122,9 @@ def _element_matches_recorded_attributes(element: Tag, issue: Dict[str, Any]) ->
         if attrs.get(key):
             checks.append(element.get(key) == attrs[key])
     if attrs.get("src"):
-        import os as _os
-
-        rec = _os.path.basename(attrs["src"])
+        rec = os.path.basename(attrs["src"])
         got = element.get("src")
-        checks.append(bool(got) and _os.path.basename(got) == rec)
+        checks.append(bool(got) and os.path.basename(got) == rec)
     if not checks:
         return True
     return any(checks)
@@ -227,12 +227,10 @@ def _match_by_attributes(soup: BeautifulSoup, issue: Dict[str, Any]) -> Optional
     # conversion) but the filename is stable: match on basename.
     src = attrs.get("src")
     if src:
-        import os as _os
-
-        filename = _os.path.basename(src)
+        filename = os.path.basename(src)
         by_name = [
             el for el in soup.find_all(tag or "img")
-            if el.get("src") and _os.path.basename(el.get("src")) == filename
+            if el.get("src") and os.path.basename(el.get("src")) == filename
         ]
         if len(by_name) == 1:
             return by_name[0]
@@ -424,33 +422,19 @@ class SelectorHelper:
             if not element:
                 return None
 
-            # Get parent
-            parent = element.parent
-
-            # Get siblings
-            siblings = list(parent.children)
-
-            # Find index of element in siblings
-            element_index = None
-            for i, sibling in enumerate(siblings):
-                if sibling is element:
-                    element_index = i
-                    break
-
-            if element_index is None:
-                return str(parent)
-
-            # Get context range
-            start = max(0, element_index - context_size)
-            end = min(len(siblings), element_index + context_size + 1)
+            # Walk outward from the element, stopping after context_size
+            # siblings each way, rather than listing the parent's children
+            # and scanning for the element's position.
+            before = list(islice(element.previous_siblings, context_size))
+            after = list(islice(element.next_siblings, context_size))
 
             # Create a new element with just the context
             context_soup = BeautifulSoup("<div></div>", "html.parser")
             context_div = context_soup.div
 
             # Add siblings in context range
-            for i in range(start, end):
-                context_div.append(siblings[i])
+            for node in [*reversed(before), element, *after]:
+                context_div.append(node)
 
             return str(context_div)
 
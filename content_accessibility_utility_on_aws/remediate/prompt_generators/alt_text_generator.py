@@ -11,12 +11,13 @@ import os
 import re
 from typing import Optional, Dict, Any
 from bs4 import BeautifulSoup, Tag, NavigableString
-from PIL import Image
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
     BedrockClient,
     AltTextGenerationError,
+    get_shared_bedrock_client,
 )
+from content_accessibility_utility_on_aws.utils.constants import DEFAULT_MODEL_ID
 from content_accessibility_utility_on_aws.remediate.helpers.text_generation import (
     strip_quotes_and_trailing_period,
 )
@@ -24,7 +25,6 @@ from content_accessibility_utility_on_aws.remediate.helpers.text_generation impo
 # Set up module-level logger
 logger = setup_logger(__name__)
 
-
 def extract_image_context(img: Tag, soup: BeautifulSoup) -> Dict[str, Any]:
     """
     Extract context information for an image from surrounding elements.
@@ -233,7 +233,7 @@ def generate_alt_text(
 
     # Generate alt text using Bedrock
     if not bedrock_client:
-        bedrock_client = BedrockClient()
+        bedrock_client = get_shared_bedrock_client(DEFAULT_MODEL_ID, None)
 
     try:
         # Generate prompt for alt text
@@ -264,6 +264,9 @@ def generate_alt_text_prompt(
     Returns:
         str: Prompt for generating alt text
     """
+    # Pillow is only loaded once an image prompt is actually built
+    from PIL import Image
+
     # Get the image dimensions and format
     try:
         with Image.open(image_path) as img:
@@ -7,6 +7,7 @@ Remediation manager for HTML accessibility issues.
 This module provides functionality for managing the remediation of accessibility issues.
 """
 
+import re
 from typing import Dict, Any, List, Optional, Callable
 from bs4 import BeautifulSoup
 
@@ -17,6 +18,7 @@ from content_accessibility_utility_on_aws.utils.logging_helper import (
 from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
     BedrockClient,
     AltTextGenerationError,
+    get_shared_bedrock_client,
 )
 from content_accessibility_utility_on_aws.utils.constants import DEFAULT_MODEL_ID
 
@@ -127,9 +129,9 @@ class RemediationManager:
         """
         model_id = self.options.get("model_id", DEFAULT_MODEL_ID)
         profile = self.options.get("profile")
-        client = BedrockClient(model_id=model_id, profile=profile)
+        client = get_shared_bedrock_client(model_id, profile)
         logger.debug(
-            f"Initialized Bedrock client with model: {model_id}, profile: {profile}"
+            f"Using Bedrock client with model: {model_id}, profile: {profile}"
         )
         return client
 
@@ -249,8 +251,19 @@ class RemediationManager:
         Returns:
             A message describing the remediation, or None if no remediation was performed
         """
-        issue_type = self._normalize_issue_type(issue.get("type"))
+        return self._remediate_typed_issue(
+            issue, self._normalize_issue_type(issue.get("type"))
+        )
+
+    def _remediate_typed_issue(
+        self, issue: Dict[str, Any], issue_type: Optional[str]
+    ) -> Optional[str]:
+        """
+        Remediate an issue whose type has already been normalized.
 
+        remediate_issues normalizes each issue's type for its own checks, so it
+        calls this directly instead of having remediate_issue normalize again.
+        """
         # Check if we have a remediation strategy for this issue type
         if issue_type in self.remediation_strategies:
             try:
@@ -501,6 +514,10 @@ class RemediationManager:
             if not issue_id:
                 issue_id = f"issue-{id(issue)}"  # Generate a unique ID if none exists
 
+            # Resolve the location once; audit issues normally carry a dict but
+            # it may be missing or None, and every detail entry reads from it.
+            location = issue.get("location") or {}
+
             try:
                 # For landmark issues, we need to handle counting differently
                 # since one landmark issue can cause multiple fixes
@@ -508,7 +525,7 @@ class RemediationManager:
                     "missing-"
                 ) and issue_type.endswith("-landmark")
 
-                result = self.remediate_issue(issue)
+                result = self._remediate_typed_issue(issue, issue_type)
 
                 # Create detailed result entry - preserve original ID
                 detail = {
@@ -533,11 +550,11 @@ class RemediationManager:
                         None if result else "Unable to apply fix automatically"
                     ),
                     "file_path": issue.get("file_path")
-                    or (issue.get("location", {}) or {}).get("file_path", ""),
+                    or location.get("file_path", ""),
                     "file_name": issue.get("file_name")
-                    or (issue.get("location", {}) or {}).get("file_name", ""),
+                    or location.get("file_name", ""),
                     "page_number": issue.get("page_number")
-                    or (issue.get("location", {}) or {}).get("page_number"),
+                    or location.get("page_number"),
                 }
 
                 # For unified format in report generation, include a location field if not present
@@ -587,8 +604,6 @@ class RemediationManager:
                     # For table remediation, we might have applied multiple fixes
                     elif "header cells across" in result:
                         # Extract the count from the message like "Added scope attributes to 15 header cells..."
-                        import re
-
                         cells_match = re.search(r"to (\d+) header cells", result)
                         if cells_match:
                             cells_count = int(cells_match.group(1))
@@ -623,11 +638,11 @@ class RemediationManager:
                     "failure_reason": "AI service required but not available",
                     "changes_applied": 0,
                     "file_path": issue.get("file_path")
-                    or (issue.get("location", {}) or {}).get("file_path", ""),
+                    or location.get("file_path", ""),
                     "file_name": issue.get("file_name")
-                    or (issue.get("location", {}) or {}).get("file_name", ""),
+                    or location.get("file_name", ""),
                     "page_number": issue.get("page_number")
-                    or (issue.get("location", {}) or {}).get("page_number"),
+                    or location.get("page_number"),
                 }
 
                 # For unified format in report generation, include a location field if not present
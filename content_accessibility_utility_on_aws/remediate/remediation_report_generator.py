@@ -40,16 +40,24 @@ def generate_remediation_report(
     logger.debug(f"Generating {format_to_use} remediation report at {output_path}")
 
     # Synchronize top-level counts with file-level totals
-    # This ensures top-level remediated count matches what's in the files
+    # This ensures top-level remediated count matches what's in the files.
+    # The same pass gathers each file's detailed issues, tagged with its path.
     if "file_results" in remediation_data:
         total_processed = 0
         total_remediated = 0
         total_failed = 0
+        issues = []
 
         for file_result in remediation_data.get("file_results", []):
-            total_processed += file_result.get("issues_processed", 0)
-            total_remediated += file_result.get("issues_remediated", 0)
-            total_failed += file_result.get("issues_failed", 0)
+            get = file_result.get
+            total_processed += get("issues_processed", 0)
+            total_remediated += get("issues_remediated", 0)
+            total_failed += get("issues_failed", 0)
+
+            file_path = get("file_path", "")
+            for issue in get("details", []):
+                issue["file_path"] = file_path
+                issues.append(issue)
 
         # Update top-level counts
         remediation_data["issues_processed"] = total_processed
@@ -57,60 +65,39 @@ def generate_remediation_report(
         remediation_data["issues_failed"] = total_failed
 
         # Ensure the summary reflects the correct counts too
-        if "summary" not in remediation_data:
-            remediation_data["summary"] = {}
+        summary = remediation_data.setdefault("summary", {})
+        summary["total_issues"] = total_processed
+        summary["issues_processed"] = total_processed
+        summary["remediated_issues"] = total_remediated
+        summary["failed_issues"] = total_failed
 
-        remediation_data["summary"]["total_issues"] = total_processed
-        remediation_data["summary"]["issues_processed"] = total_processed
-        remediation_data["summary"]["remediated_issues"] = total_remediated
-        remediation_data["summary"]["failed_issues"] = total_failed
+        # Add detailed issue information from file_results to the report data
+        if issues:
+            remediation_data["issues"] = issues
+            logger.debug(f"Added {len(issues)} detailed issues from file_results")
 
-    # Make sure all issues in the issues array have their remediation_status
-    # properly reflected in the top-level counts
-    if "issues" in remediation_data:
+    # Without file_results, derive the top-level counts from the issues'
+    # remediation_status
+    elif "issues" in remediation_data:
+        issues = remediation_data["issues"]
+        issue_count = len(issues)
         remediated_count = 0
-        failed_count = 0
 
-        for issue in remediation_data["issues"]:
+        for issue in issues:
             if issue.get("remediation_status") == "remediated":
                 remediated_count += 1
-            else:
-                failed_count += 1
-
-        # If there's no file_results section, use these counts
-        if "file_results" not in remediation_data:
-            remediation_data["issues_processed"] = len(remediation_data["issues"])
-            remediation_data["issues_remediated"] = remediated_count
-            remediation_data["issues_failed"] = failed_count
-
-            # Update summary as well
-            if "summary" not in remediation_data:
-                remediation_data["summary"] = {}
-
-            remediation_data["summary"]["total_issues"] = len(
-                remediation_data["issues"]
-            )
-            remediation_data["summary"]["issues_processed"] = len(
-                remediation_data["issues"]
-            )
-            remediation_data["summary"]["remediated_issues"] = remediated_count
-            remediation_data["summary"]["failed_issues"] = failed_count
-
-        # Add detailed issue information to the report data if available from file_results
-    if "file_results" in remediation_data:
-        # Extract issues from file results
-        issues = []
-        for file_result in remediation_data.get("file_results", []):
-            file_issues = file_result.get("details", [])
-            for issue in file_issues:
-                # Add file path to each issue
-                issue["file_path"] = file_result.get("file_path", "")
-                issues.append(issue)
-
-        # Add issues to remediation data
-        if issues:
-            remediation_data["issues"] = issues
-            logger.debug(f"Added {len(issues)} detailed issues from file_results")
+        failed_count = issue_count - remediated_count
+
+        remediation_data["issues_processed"] = issue_count
+        remediation_data["issues_remediated"] = remediated_count
+        remediation_data["issues_failed"] = failed_count
+
+        # Update summary as well
+        summary = remediation_data.setdefault("summary", {})
+        summary["total_issues"] = issue_count
+        summary["issues_processed"] = issue_count
+        summary["remediated_issues"] = remediated_count
+        summary["failed_issues"] = failed_count
 
     # Use the unified report generator
     prepared_data = utils_generate_report(
@@ -7,10 +7,26 @@ Color contrast accessibility remediation strategies.
 This module provides remediation strategies for color contrast-related accessibility issues.
 """
 
-from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, Any, List, Optional
+from bs4 import BeautifulSoup, Tag
 import re
 
+from content_accessibility_utility_on_aws.remediate.helpers.selector_helper import (
+    find_element_from_issue,
+)
+from content_accessibility_utility_on_aws.utils.color_contrast import (
+    BLACK_WHITE_CROSSOVER,
+    relative_luminance,
+)
+
+# Patterns applied to every contrast issue, compiled once at import.
+# Tag name and (optional) class attribute of the element's opening tag, in
+# one match.
+_OPENING_TAG = re.compile(
+    r'<(?P<tag>[a-zA-Z0-9]+)(?:[^>]*?\sclass="(?P<classes>[^"]*)")?'
+)
+_RGB_FUNCTION = re.compile(r"rgba?\((\d+),\s*(\d+),\s*(\d+)")
+
 
 def remediate_insufficient_color_contrast(
     soup: BeautifulSoup, issue: Dict[str, Any], *args
@@ -26,39 +42,15 @@ def remediate_insufficient_color_contrast(
     Returns:
         A message describing the remediation, or None if no remediation was performed
     """
-    # Find the element from the issue
-    element_str = issue.get("element", "")
-    if not element_str:
-        return None
-
-    # Extract element tag name
-    tag_match = re.match(r"<([a-zA-Z0-9]+)", element_str)
-    if not tag_match:
-        return None
-
-    tag_name = tag_match.group(1)
-
-    # Try to find the element in the document
-    # This is a simplified approach - in a real implementation, we would need a more robust way to find the element
-    elements = soup.find_all(tag_name)
-    if not elements:
-        return None
-
-    # Extract class information if available
-    class_match = re.search(r'class="([^"]*)"', element_str)
-    class_names = class_match.group(1).split() if class_match else []
-
-    # Find elements with matching classes
-    matching_elements = []
-    for element in elements:
-        if class_names:
-            element_classes = element.get("class", [])
-            if all(cls in element_classes for cls in class_names):
-                matching_elements.append(element)
-        else:
-            # If no class to match, just use the first element of the tag type
-            matching_elements.append(element)
-            break
+    # Resolve the exact element from the issue's recorded path/attributes: a
+    # direct selector match rather than a scan over every element of the tag.
+    # No element index is kept across issues, since other strategies
+    # restructure the tree between calls.
+    element = find_element_from_issue(soup, issue)
+    if element is not None:
+        matching_elements = [element]
+    else:
+        matching_elements = _find_elements_by_markup(soup, issue.get("element", ""))
 
     if not matching_elements:
         return None
@@ -68,59 +60,154 @@ def remediate_insufficient_color_contrast(
         # Determine if we should adjust text color or background color
         # For simplicity, we'll always adjust text color to black or white
 
-        # Check if the element has inline style with background-color
-        style = element.get("style", "")
-        bg_color_match = re.search(r"background-color:\s*([^;]+)", style)
-
-        if bg_color_match:
-            bg_color = bg_color_match.group(1).strip().lower()
+        # Parse the inline style once; colors are read from and written back
+        # to the declarations rather than pattern-rewritten in the string.
+        declarations = _parse_style(element.get("style", ""))
 
+        # Check if the element has inline style with background-color
+        bg_color = declarations.get("background-color")
+        if bg_color:
             # Determine if background is light or dark (simplified)
-            is_dark_bg = _is_dark_color(bg_color)
+            is_dark_bg = _is_dark_color(bg_color.lower())
 
             # Set text color based on background
             new_color = "#FFFFFF" if is_dark_bg else "#000000"
 
-            # Update or add color to style
-            if "color:" in style:
-                style = re.sub(r"color:\s*[^;]+", f"color: {new_color}", style)
-            else:
-                style += f"; color: {new_color}"
-
-            element["style"] = style
+            declarations["color"] = new_color
+            element["style"] = _format_style(declarations)
             return f"Adjusted text color to {new_color} for better contrast"
 
         # If no background color in style, check for text color
-        color_match = re.search(r"color:\s*([^;]+)", style)
-        if color_match:
-            text_color = color_match.group(1).strip().lower()
-
+        text_color = declarations.get("color")
+        if text_color:
             # Determine if text is light or dark (simplified)
-            is_dark_text = _is_dark_color(text_color)
+            is_dark_text = _is_dark_color(text_color.lower())
 
             # Set background color based on text
             new_bg_color = "#000000" if is_dark_text else "#FFFFFF"
 
-            # Update or add background-color to style
-            if "background-color:" in style:
-                style = re.sub(
-                    r"background-color:\s*[^;]+",
-                    f"background-color: {new_bg_color}",
-                    style,
-                )
-            else:
-                style += f"; background-color: {new_bg_color}"
-
-            element["style"] = style
+            declarations["background-color"] = new_bg_color
+            element["style"] = _format_style(declarations)
             return f"Adjusted background color to {new_bg_color} for better contrast"
 
-        # If no inline styles, add them
-        element["style"] = "color: #000000; background-color: #FFFFFF"
+        # If no inline colors, add them
+        declarations["color"] = "#000000"
+        declarations["background-color"] = "#FFFFFF"
+        element["style"] = _format_style(declarations)
         return "Added high contrast colors (black text on white background)"
 
     return None
 
 
+def _find_elements_by_markup(soup: BeautifulSoup, element_str: str) -> List[Tag]:
+    """
+    Find candidate elements from the issue's element markup (tag and classes).
+
+    Fallback for issues whose recorded location no longer resolves.
+
+    Args:
+        soup: The BeautifulSoup object representing the HTML document
+        element_str: The element's opening markup as recorded by the audit
+
+    Returns:
+        Matching elements, or an empty list
+    """
+    if not element_str:
+        return []
+
+    # Extract element tag name and class information, if available
+    tag_match = _OPENING_TAG.match(element_str)
+    if not tag_match:
+        return []
+
+    tag_name = tag_match.group("tag")
+    class_names = (tag_match.group("classes") or "").split()
+
+    # Let the tree search filter on the first class (and stop at the first hit
+    # when there is no class to match) instead of collecting every element of
+    # the tag type.
+    if class_names:
+        return [
+            element
+            for element in soup.find_all(tag_name, class_=class_names[0])
+            if all(cls in element.get("class", []) for cls in class_names[1:])
+        ]
+
+    # If no class to match, just use the first element of the tag type
+    first = soup.find(tag_name)
+    return [first] if first else []
+
+
+def _parse_style(style: str) -> Dict[str, str]:
+    """
+    Parse an inline style string into an ordered property-to-value mapping.
+
+    Args:
+        style: The element's inline style string
+
+    Returns:
+        Dictionary of lower-cased property names to stripped values
+    """
+    declarations = {}
+    for declaration in _split_declarations(style):
+        prop, sep, value = declaration.partition(":")
+        if sep and prop.strip():
+            declarations[prop.strip().lower()] = value.strip()
+    return declarations
+
+
+def _split_declarations(style: str) -> List[str]:
+    """
+    Split an inline style string on the semicolons that end declarations.
+
+    Semicolons inside quotes or parentheses belong to a value (e.g. a data URL
+    in ``url("data:image/png;base64,...")``) and do not split it.
+
+    Args:
+        style: The element's inline style string
+
+    Returns:
+        The declaration strings, unstripped
+    """
+    declarations = []
+    start = 0
+    depth = 0
+    quote = None
+    escaped = False
+    for index, char in enumerate(style):
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif quote:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "(":
+            depth += 1
+        elif char == ")" and depth:
+            depth -= 1
+        elif char == ";" and not depth:
+            declarations.append(style[start:index])
+            start = index + 1
+    declarations.append(style[start:])
+    return declarations
+
+
+def _format_style(declarations: Dict[str, str]) -> str:
+    """
+    Serialize declarations produced by ``_parse_style`` back to a style string.
+
+    Args:
+        declarations: Dictionary of property names to values
+
+    Returns:
+        The inline style string
+    """
+    return "; ".join(f"{prop}: {value}" for prop, value in declarations.items())
+
+
 def _is_dark_color(color: str) -> bool:
     """
     Determine if a color is dark or light.
@@ -146,11 +233,9 @@ def _is_dark_color(color: str) -> bool:
 
     # Handle rgb/rgba colors
     elif color.startswith("rgb"):
-        rgb_match = re.search(r"rgba?\((\d+),\s*(\d+),\s*(\d+)", color)
+        rgb_match = _RGB_FUNCTION.search(color)
         if rgb_match:
-            r = int(rgb_match.group(1))
-            g = int(rgb_match.group(2))
-            b = int(rgb_match.group(3))
+            r, g, b = (min(int(c), 255) for c in rgb_match.groups())
         else:
             return False  # Invalid rgb
 
@@ -170,9 +255,5 @@ def _is_dark_color(color: str) -> bool:
     else:
         return False  # Unknown color
 
-    # Calculate perceived brightness
-    # Formula: (0.299*R + 0.587*G + 0.114*B)
-    brightness = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-
-    # Return True if dark (brightness < 0.5)
-    return brightness < 0.5
+    # Dark means white contrasts better than black against it (WCAG luminance)
+    return relative_luminance((r, g, b)) < BLACK_WHITE_CROSSOVER
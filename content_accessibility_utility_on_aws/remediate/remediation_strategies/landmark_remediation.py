@@ -29,12 +29,14 @@ def remediate_missing_skip_link(
     Returns:
         A message describing the remediation or None if no remediation was performed
     """
-    # Check if skip link already exists
-    skip_links = soup.find_all("a", string=lambda s: s and "skip" in s.lower())
-    for link in skip_links:
-        if link.get("href", "").startswith("#") and (
-            "skip" in link.get("class", [""])[0].lower() if link.get("class") else False
-        ):
+    # Check if skip link already exists. Only fragment links can be skip links,
+    # so narrow to those with the selector before looking at any text.
+    for link in soup.select('a[href^="#"]'):
+        text = link.string
+        if not (text and "skip" in text.lower()):
+            continue
+        classes = link.get("class")
+        if classes and "skip" in classes[0].lower():
             logger.debug("Skip link already exists")
             return "Skip link already exists - no remediation needed"
 
@@ -52,18 +54,17 @@ def remediate_missing_skip_link(
             main = soup.new_tag("main")
             main["role"] = "main"
 
-            # Find all direct children of body
-            body_children = list(body.children)
-
             # Find header and nav elements if they exist
             header = soup.find("header") or soup.find(attrs={"role": "banner"})
             nav = soup.find("nav") or soup.find(attrs={"role": "navigation"})
 
-            # Remove header and nav from body_children list
-            if header in body_children:
-                body_children.remove(header)
-            if nav in body_children:
-                body_children.remove(nav)
+            # Direct children of body other than header and nav. Compared by
+            # identity: Tag equality compares whole subtrees.
+            body_children = [
+                child
+                for child in body.children
+                if child is not header and child is not nav
+            ]
 
             # Add remaining children to main element
             for child in body_children:
@@ -347,10 +347,15 @@ def infer_scope_with_confidence(table: Tag, th: Tag) -> Tuple[str, bool]:
     if th.parent.parent and th.parent.parent.name == "thead":
         return "col", True
 
-    all_rows = table.find_all("tr")
-    row_index = all_rows.index(parent_row) if parent_row in all_rows else -1
-    row_cells = parent_row.find_all(["th", "td"])
-    cell_index = row_cells.index(th) if th in row_cells else -1
+    # Locate by identity: Tag equality compares whole subtrees, which is slow
+    # and would match the first of two identical rows or cells.
+    row_index = next(
+        (i for i, row in enumerate(table.find_all("tr")) if row is parent_row), -1
+    )
+    cell_index = next(
+        (i for i, cell in enumerate(parent_row.find_all(["th", "td"])) if cell is th),
+        -1,
+    )
 
     # First row: column header (covers the top-left corner cell, which is a
     # column header by convention even when the first column also holds row
@@ -7,6 +7,9 @@ Services for HTML accessibility remediation.
 This package provides services used by the HTML accessibility remediator.
 """
 
-from content_accessibility_utility_on_aws.remediate.services.bedrock_client import BedrockClient
+from content_accessibility_utility_on_aws.remediate.services.bedrock_client import (
+    BedrockClient,
+    get_shared_bedrock_client,
+)
 
-__all__ = ["BedrockClient"]
+__all__ = ["BedrockClient", "get_shared_bedrock_client"]
@@ -10,6 +10,7 @@ This module provides a client for interacting with AWS Bedrock for multimodal AI
 import boto3
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from botocore.config import Config
@@ -441,3 +442,15 @@ class BedrockClient:
         else:
             # Default to png
             return "image/png"
+
+
+@lru_cache(maxsize=4)
+def get_shared_bedrock_client(model_id: str, profile: Optional[str]) -> BedrockClient:
+    """
+    Return the process-wide BedrockClient for a model and profile.
+
+    Building a client creates a boto3 session and runtime client, so callers
+    that would otherwise build one per file, page or image share one per
+    configuration instead. The client is created on first use.
+    """
+    return BedrockClient(model_id=model_id, profile=profile)
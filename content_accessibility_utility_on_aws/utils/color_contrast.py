@@ -14,6 +14,7 @@ color without a model.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional, Tuple
 
 # WCAG 2.x minimum contrast ratios.
@@ -21,16 +22,32 @@ AA_NORMAL_TEXT = 4.5
 AA_LARGE_TEXT = 3.0
 AA_NON_TEXT = 3.0  # UI components / graphical objects (1.4.11)
 
+# Luminance at which black and white give the same contrast ratio, i.e.
+# (1 + 0.05) / (L + 0.05) == (L + 0.05) / (0 + 0.05). Above it dark text
+# contrasts better, below it light text does.
+BLACK_WHITE_CROSSOVER = (1.05 * 0.05) ** 0.5 - 0.05
+
 
 def _gamma(value: float) -> float:
     """Gamma-expand one sRGB channel (0-1) per the WCAG definition."""
     return value / 12.92 if value <= 0.03928 else ((value + 0.055) / 1.055) ** 2.4
 
 
+# Channels are always 8-bit, so every gamma-expanded value is precomputed once.
+_LINEAR_CHANNEL = tuple(_gamma(c / 255) for c in range(256))
+
+
+# A page repeats a handful of colors (white, black, brand colors) across every
+# text element, so the luminance and nudge results are memoized per color.
+@lru_cache(maxsize=512)
 def relative_luminance(rgb: Tuple[int, int, int]) -> float:
     """Relative luminance of an sRGB color, per WCAG 2.x."""
-    r, g, b = (c / 255 for c in rgb)
-    return 0.2126 * _gamma(r) + 0.7152 * _gamma(g) + 0.0722 * _gamma(b)
+    r, g, b = rgb
+    return (
+        0.2126 * _LINEAR_CHANNEL[r]
+        + 0.7152 * _LINEAR_CHANNEL[g]
+        + 0.0722 * _LINEAR_CHANNEL[b]
+    )
 
 
 def contrast_ratio(rgb1: Tuple[int, int, int], rgb2: Tuple[int, int, int]) -> float:
@@ -56,9 +73,12 @@ def parse_color(value: str) -> Optional[Tuple[int, int, int]]:
             h = "".join(c * 2 for c in h)
         if len(h) == 6:
             try:
-                return tuple(int(h[i : i + 2], 16) for i in (0, 2, 4))  # type: ignore[return-value]
+                channels = bytes.fromhex(h)
             except ValueError:
                 return None
+            # fromhex skips embedded spaces, so "ab  cd" parses to two bytes.
+            if len(channels) == 3:
+                return tuple(channels)  # type: ignore[return-value]
         return None
     if v.startswith(("rgb(", "rgba(")):
         inner = v[v.index("(") + 1 : v.rindex(")")]
@@ -80,6 +100,7 @@ def _scale(rgb: Tuple[int, int, int], factor: float) -> Tuple[int, int, int]:
     return tuple(max(0, min(255, int(round(c * factor)))) for c in rgb)  # type: ignore[return-value]
 
 
+@lru_cache(maxsize=256)
 def adjust_for_contrast(
     fg: Tuple[int, int, int],
     bg: Tuple[int, int, int],
@@ -99,7 +120,7 @@ def adjust_for_contrast(
 
     bg_lum = relative_luminance(bg)
     # Darker text on light backgrounds, lighter text on dark backgrounds.
-    darken = bg_lum > 0.5
+    darken = bg_lum > BLACK_WHITE_CROSSOVER
     steps = 20
     for i in range(1, steps + 1):
         factor = 1 - i / steps if darken else 1 + i / steps
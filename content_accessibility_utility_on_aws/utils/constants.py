@@ -54,6 +54,11 @@ def model_supports_temperature(model_id: str) -> bool:
 # they detect against and enforce to cannot drift apart.
 MIN_TARGET_SIZE_PX = 24
 
+# Heading tag names, lowest level first. Passed as a list to a single
+# ``find_all`` so collecting every heading is one tree walk rather than one walk
+# per level.
+HEADING_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6"]
+
 # Default number of translatable segments per Bedrock call for the i18n package.
 # Kept modest so each call's JSON array stays within the model's output-token
 # budget even for verbose target languages and reasoning-capable models. Defined
@@ -23,6 +23,9 @@ _PX_DECLARATION = re.compile(
     re.IGNORECASE,
 )
 
+# Matches a legacy HTML ``width``/``height`` attribute value like "12" or "12px".
+_PX_ATTRIBUTE = re.compile(r"^\s*([0-9.]+)\s*(px)?\s*$")
+
 
 def declared_dimension(element: Tag, dimension: str) -> Optional[float]:
     """
@@ -39,24 +42,28 @@ def declared_dimension(element: Tag, dimension: str) -> Optional[float]:
     Returns:
         The declared size in CSS pixels, or None.
     """
-    style = (element.get("style") or "") if hasattr(element, "get") else ""
-    # Parse declarations with the same property-anchored regex strip uses, so a
-    # hyphenated property (e.g. "max-width") is never mistaken for "width".
-    declared = {}
-    for decl in style.split(";"):
-        match = _PX_DECLARATION.match(decl)
-        if match:
-            try:
-                declared[match.group(1).lower()] = float(match.group(2))
-            except ValueError:
-                pass
-    for prop in (f"min-{dimension}", dimension):
-        if prop in declared:
-            return declared[prop]
-
-    attr_value = element.get(dimension) if hasattr(element, "get") else None
+    # Read attributes straight from the dict: one lookup per attribute, and an
+    # element without inline style skips declaration parsing entirely.
+    attrs = getattr(element, "attrs", None) or {}
+    style = attrs.get("style")
+    if style:
+        # Parse declarations with the same property-anchored regex strip uses, so a
+        # hyphenated property (e.g. "max-width") is never mistaken for "width".
+        declared = {}
+        for decl in style.split(";"):
+            match = _PX_DECLARATION.match(decl)
+            if match:
+                try:
+                    declared[match.group(1).lower()] = float(match.group(2))
+                except ValueError:
+                    pass
+        for prop in (f"min-{dimension}", dimension):
+            if prop in declared:
+                return declared[prop]
+
+    attr_value = attrs.get(dimension)
     if attr_value:
-        match = re.match(r"^\s*([0-9.]+)\s*(px)?\s*$", str(attr_value))
+        match = _PX_ATTRIBUTE.match(str(attr_value))
         if match:
             try:
                 return float(match.group(1))
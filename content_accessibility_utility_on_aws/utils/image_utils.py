@@ -12,7 +12,6 @@ import os
 import shutil
 from typing import List, Optional
 from bs4 import BeautifulSoup
-from PIL import Image
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 
@@ -56,6 +55,10 @@ def resize_image(image_path: str, max_size: int = 4000000, quality: int = 85) ->
         if original_size <= max_size:
             return image_path
 
+        # Imported here: only oversized images need Pillow, so audits and
+        # remediations without them never load it
+        from PIL import Image
+
         with Image.open(image_path) as img:
             # Get format or default to PNG
             img_format = img.format or "PNG"
@@ -9,10 +9,12 @@ including a unified report that combines audit and remediation data.
 """
 
 import os
+import gzip
 import json
-from typing import Dict, Any
-
-from flask import Flask, render_template
+import filecmp
+import shutil
+from collections import Counter
+from typing import Any, Dict, List, Optional
 
 from content_accessibility_utility_on_aws.utils.logging_helper import setup_logger
 
@@ -20,12 +22,63 @@ from content_accessibility_utility_on_aws.utils.logging_helper import setup_logg
 # Set up module-level logger
 logger = setup_logger(__name__)
 
+# HTML report template, compiled by a Flask app's Jinja environment (which
+# autoescapes .html templates) on first use and kept for the process
+_REPORT_TEMPLATE_NAME = "unified_report.html"
+_report_template = None
+
+# Stylesheet for HTML reports, inlined by default or copied next to the report
+_REPORT_CSS_NAME = "unified_report.css"
+_REPORT_CSS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "templates", _REPORT_CSS_NAME
+)
+
+# Static blocks of the text report: the title and summary heading, and the
+# heading that closes the summary and opens the issue list
+_TEXT_HEADER_TEMPLATE = "{title}\n" + "=" * 80 + "\n\nSUMMARY\n" + "-" * 80 + "\n"
+_TEXT_ISSUES_HEADER = "\nISSUES\n" + "-" * 80 + "\n"
+
+# Per-issue block of the text report; optional lines are appended after it
+_TEXT_ISSUE_TEMPLATE = (
+    "Issue {number}:\n"
+    "  Type: {type}\n"
+    "  Severity: {severity}\n"
+    "  Message: {message}"
+)
+
+# Folds line breaks in free-text fields so each stays on its labelled line
+_TEXT_LINE_BREAKS = str.maketrans({"\r": " ", "\n": " "})
+
+# Severity levels tallied in the unified report, in display order
+_SEVERITY_LEVELS = ("critical", "major", "minor", "info")
+
+# Header rows of the CSV reports; the row builders below follow these orders
+_ACCESSIBILITY_CSV_HEADER = (
+    "ID",
+    "Type",
+    "Severity",
+    "Message",
+    "Selector",
+    "File Path",
+    "Fix Available",
+)
+_REMEDIATION_CSV_HEADER = (
+    "ID",
+    "Type",
+    "Severity",
+    "Status",
+    "Message",
+    "Selector",
+    "File Path",
+)
+
 
 def generate_report(
     report_data: Dict[str, Any],
     output_path: str,
     report_format: str = "html",
     report_type: str = "accessibility",
+    inline_css: bool = True,
 ) -> Dict[str, Any]:
     """
     Generate a report in the specified format.
@@ -35,6 +88,8 @@ def generate_report(
         output_path: Path where the report will be saved
         report_format: Type of report to generate ('html', 'json', 'text', or 'csv')
         report_type: Type of report ('accessibility', 'remediation', or 'unified')
+        inline_css: For HTML reports, embed the stylesheet (default) rather than
+            linking to a shared copy in the output directory
 
     Returns:
         Standardized report data
@@ -73,7 +128,9 @@ def generate_report(
     if report_format == "json":
         return generate_json_report(report_data, output_path)
     elif report_format == "html":
-        return generate_html_report(report_data, output_path, report_type)
+        return generate_html_report(
+            report_data, output_path, report_type, inline_css=inline_css
+        )
     elif report_format == "text":
         return generate_text_report(report_data, output_path, report_type)
     elif report_format == "csv":
@@ -85,14 +142,16 @@ def generate_report(
 
 
 def generate_json_report(
-    report_data: Dict[str, Any], output_path: str
+    report_data: Dict[str, Any], output_path: str, indent: Optional[int] = 2
 ) -> Dict[str, Any]:
     """
     Generate a JSON report.
 
     Args:
         report_data: Dictionary containing the report data
-        output_path: Path where the report will be saved
+        output_path: Path where the report will be saved; a ".gz" suffix
+            writes the report gzip-compressed
+        indent: Indentation level, or None for compact machine-readable output
 
     Returns:
         The report data
@@ -101,8 +160,8 @@ def generate_json_report(
         # Create a serializable copy of the data
         serializable_data = prepare_for_json_serialization(report_data)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(serializable_data, f, indent=2)
+        with _open_report_file(output_path) as f:
+            json.dump(serializable_data, f, **_json_layout(indent))
 
         logger.info(f"Generated JSON report: {output_path}")
         return report_data
@@ -110,12 +169,27 @@ def generate_json_report(
         logger.warning(f"Error generating JSON report: {str(e)}")
         # Fallback to simpler JSON structure
         minimal_data = create_minimal_report(report_data)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(minimal_data, f, indent=2)
+        with _open_report_file(output_path) as f:
+            json.dump(minimal_data, f, **_json_layout(indent))
         logger.info(f"Generated simplified JSON report: {output_path}")
         return report_data
 
 
+def _open_report_file(output_path: str):
+    """Open output_path for writing text, gzip-compressed for a ".gz" suffix."""
+    if output_path.endswith(".gz"):
+        # Compress while writing; level 1 keeps the CPU cost negligible
+        return gzip.open(output_path, "wt", encoding="utf-8", compresslevel=1)
+    return open(output_path, "w", encoding="utf-8")
+
+
+def _json_layout(indent: Optional[int]) -> Dict[str, Any]:
+    """Return json.dump keyword arguments for the given indentation."""
+    if indent is None:
+        return {"separators": (",", ":")}
+    return {"indent": indent}
+
+
 def prepare_for_json_serialization(data, depth=20, visited=None):
     """
     Prepare a data structure for JSON serialization by removing circular references and limiting recursion depth.
@@ -233,15 +307,21 @@ def create_minimal_report(report_data: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def generate_html_report(
-    report_data: Dict[str, Any], output_path: str, report_type: str
+    report_data: Dict[str, Any],
+    output_path: str,
+    report_type: str,
+    inline_css: bool = True,
 ) -> Dict[str, Any]:
     """
-    Generate an HTML report using Flask's render_template.
+    Generate an HTML report from the unified report template.
 
     Args:
         report_data: Dictionary containing the report data
-        output_path: Path where the report will be saved
+        output_path: Path where the report will be saved; a ".gz" suffix
+            writes the report gzip-compressed
         report_type: Type of report ('accessibility' or 'remediation')
+        inline_css: If True, embed the stylesheet so the report is a single
+            file; otherwise link to a copy written once per output directory
 
     Returns:
         The report data
@@ -249,9 +329,13 @@ def generate_html_report(
     # Process data for unified report before rendering
     report_data = prepare_unified_report_data(report_data)
 
+    issues = report_data.get("issues", [])
+
     # Prepare data based on the report type
     # For accessibility reports, calculate issue counts by severity and category
-    if report_type == "accessibility":
+    tally = report_type == "accessibility"
+    count_severity = False
+    if tally:
         # Make sure report_data has necessary fields
         if "total_issues" not in report_data and "issues" in report_data:
             report_data["total_issues"] = len(report_data["issues"])
@@ -266,51 +350,55 @@ def generate_html_report(
             severity_counts = report_data["summary"]["severity_counts"]
         elif not severity_counts:
             severity_counts = {"critical": 0, "major": 0, "minor": 0}
-
-            # Count issues by severity if not already counted
-            for issue in report_data.get("issues", []):
+            count_severity = True
+
+    # Tally severities and issue types and fill in display messages in a
+    # single pass over the issues
+    issue_type_counts = Counter()
+    for issue in issues:
+        if tally:
+            issue_type_counts[issue.get("type", "unknown")] += 1
+            if count_severity:
                 severity = issue.get("severity", "minor")
                 if severity in severity_counts:
                     severity_counts[severity] += 1
 
-        # Store severity counts at the top level for the template
-        report_data["severity_counts"] = severity_counts
-
-        # Calculate issue type counts
-        issue_type_counts = {}
-        for issue in report_data.get("issues", []):
-            issue_type = issue.get("type", "unknown")
-            if issue_type not in issue_type_counts:
-                issue_type_counts[issue_type] = 0
-            issue_type_counts[issue_type] += 1
-
-        # Add the counts to the report data
-        report_data["issue_type_counts"] = issue_type_counts
-
-    # Ensure all issues have messages for display purposes
-    for issue in report_data.get("issues", []):
+        # Ensure all issues have messages for display purposes
         if not issue.get("message"):
             issue_type = issue.get("type", "unknown issue")
             issue["message"] = f"{issue_type} identified"
 
-    try:
-        # Create a temporary Flask app context
-        app = Flask(__name__)
+    if tally:
+        # Store severity and issue type counts at the top level for the template
+        report_data["severity_counts"] = severity_counts
+        report_data["issue_type_counts"] = dict(issue_type_counts)
 
-        # Render the template with Flask's render_template
-        with app.app_context():
-            template_file = "unified_report.html"
-            logger.debug(f"Using template file: {template_file}")
-            html = render_template(
-                template_file,
-                report=report_data
-            )
+    # Resolve the remediation success rate and its progress bar class here
+    # rather than re-deriving the ratio in several template expressions
+    if (
+        "issues_remediated" in report_data
+        and "issues_processed" in report_data
+        and report_data["issues_processed"] > 0
+    ):
+        ratio = report_data["issues_remediated"] / report_data["issues_processed"]
+        report_data["remediation_rate"] = int(ratio * 100)
+        report_data["remediation_rate_class"] = (
+            "success" if ratio > 0.8 else ("warning" if ratio > 0.5 else "danger")
+        )
 
-        logger.info("Using Flask's render_template for secure HTML generation")
+    try:
+        # Render the compiled template directly; it uses no request or app
+        # context, so there is no context to push per report. The output is
+        # streamed to the file rather than built up as one string first.
+        logger.debug(f"Using template file: {_REPORT_TEMPLATE_NAME}")
+        stream = _get_report_template().stream(
+            report=report_data,
+            css_href=None if inline_css else _copy_report_css(output_path),
+        )
+        with _open_report_file(output_path) as f:
+            stream.dump(f)
 
-        # Write the HTML to the output file
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        logger.info("Using Flask's Jinja environment for secure HTML generation")
 
         logger.info(f"Generated HTML report: {output_path}")
         return report_data
@@ -321,6 +409,67 @@ def generate_html_report(
         return generate_json_report(report_data, output_path)
 
 
+def _get_report_template():
+    """Return the compiled HTML report template, compiling it on first use."""
+    global _report_template
+    if _report_template is None:
+        # Imported here so JSON, text and CSV reports never load Flask/Jinja
+        from flask import Flask
+
+        app = Flask(__name__)
+        # Persist the compiled template so later processes (e.g. short CLI
+        # runs) skip recompiling it
+        bytecode_cache = _get_template_bytecode_cache()
+        if bytecode_cache is not None:
+            app.jinja_options = {**app.jinja_options, "bytecode_cache": bytecode_cache}
+        # Read the stylesheet once and expose it to the template as a global,
+        # rather than including the CSS file on every inline render
+        with open(_REPORT_CSS_PATH, "r", encoding="utf-8") as f:
+            app.jinja_env.globals["report_css"] = _strip_license_header(f.read())
+        _report_template = app.jinja_env.get_template(_REPORT_TEMPLATE_NAME)
+    return _report_template
+
+
+def _get_template_bytecode_cache():
+    """
+    Return the bytecode cache for the report template, or None if disabled.
+
+    The A11Y_REPORT_TEMPLATE_CACHE environment variable names the cache
+    directory, or is "off" to disable the cache. When unset, Jinja's per-user
+    directory under the system temp directory is used.
+    """
+    from jinja2 import FileSystemBytecodeCache
+
+    setting = os.environ.get("A11Y_REPORT_TEMPLATE_CACHE", "")
+    if setting.lower() == "off":
+        return None
+    try:
+        if setting:
+            os.makedirs(setting, exist_ok=True)
+        return FileSystemBytecodeCache(setting or None)
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Template bytecode cache unavailable: {e}")
+        return None
+
+
+def _strip_license_header(css: str) -> str:
+    """Drop the stylesheet's leading license comment before it is inlined."""
+    if css.startswith("/*"):
+        css = css.split("*/", 1)[1]
+    return css.strip("\n")
+
+
+def _copy_report_css(output_path: str) -> str:
+    """Copy the report stylesheet next to output_path unless an identical copy is there."""
+    css_path = os.path.join(os.path.dirname(output_path), _REPORT_CSS_NAME)
+    if not (
+        os.path.exists(css_path)
+        and filecmp.cmp(_REPORT_CSS_PATH, css_path, shallow=False)
+    ):
+        shutil.copyfile(_REPORT_CSS_PATH, css_path)
+    return _REPORT_CSS_NAME
+
+
 def generate_text_report(
     report_data: Dict[str, Any], output_path: str, report_type: str
 ) -> Dict[str, Any]:
@@ -335,74 +484,68 @@ def generate_text_report(
     Returns:
         The report data
     """
-    # Generate text report
-    text = []
-
-    # Add report title based on report type
+    # Report title based on report type
     if report_type == "accessibility":
-        text.append("ACCESSIBILITY AUDIT REPORT")
+        title = "ACCESSIBILITY AUDIT REPORT"
     elif report_type == "unified":
-        text.append("ACCESSIBILITY AUDIT & REMEDIATION REPORT")
+        title = "ACCESSIBILITY AUDIT & REMEDIATION REPORT"
     else:
-        text.append("ACCESSIBILITY REMEDIATION REPORT")
+        title = "ACCESSIBILITY REMEDIATION REPORT"
 
-    text.append("=" * 80)
-    text.append("")
-
-    # Add summary section
-    text.append("SUMMARY")
-    text.append("-" * 80)
-
-    # Add file information
-    if "html_path" in report_data:
-        text.append(f"File: {report_data.get('html_path')}")
-
-    # Add issue counts
-    if "total_issues" in report_data:
-        text.append(f"Total issues: {report_data.get('total_issues', 0)}")
-    elif "issues_processed" in report_data:
-        text.append(f"Issues processed: {report_data.get('issues_processed', 0)}")
-
-    if "issues_remediated" in report_data:
-        text.append(f"Issues remediated: {report_data.get('issues_remediated', 0)}")
-
-    if "issues_failed" in report_data:
-        text.append(f"Issues failed: {report_data.get('issues_failed', 0)}")
-
-    text.append("")
-
-    # Add issues section
-    text.append("ISSUES")
-    text.append("-" * 80)
-
-    # Add issues details
     issues = report_data.get("issues", []) or report_data.get("details", [])
-    if issues:
-        for i, issue in enumerate(issues):
-            text.append(f"Issue {i+1}:")
-            text.append(f"  Type: {issue.get('type', 'unknown')}")
-            text.append(f"  Severity: {issue.get('severity', 'unknown')}")
-            text.append(f"  Message: {issue.get('message', '')}")
-
-            if "selector" in issue and issue["selector"]:
-                text.append(f"  Selector: {issue.get('selector', '')}")
-
-            if "remediation_status" in issue:
-                text.append(f"  Status: {issue.get('remediation_status', 'unknown')}")
 
-            text.append("")
-    else:
-        text.append("No issues found.")
-        text.append("")
-
-    # Write the text to the output file
+    # Write the report straight to the output file
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(text))
+        w = f.write
+        w(_TEXT_HEADER_TEMPLATE.format(title=title))
+
+        # Add file information
+        if "html_path" in report_data:
+            w(f"File: {report_data.get('html_path')}\n")
+
+        # Add issue counts
+        if "total_issues" in report_data:
+            w(f"Total issues: {report_data.get('total_issues', 0)}\n")
+        elif "issues_processed" in report_data:
+            w(f"Issues processed: {report_data.get('issues_processed', 0)}\n")
+
+        if "issues_remediated" in report_data:
+            w(f"Issues remediated: {report_data.get('issues_remediated', 0)}\n")
+
+        if "issues_failed" in report_data:
+            w(f"Issues failed: {report_data.get('issues_failed', 0)}\n")
+
+        # Add issues section
+        w(_TEXT_ISSUES_HEADER)
+
+        # Add issues details, separated by blank lines
+        if issues:
+            for number, issue in enumerate(issues, 1):
+                if number > 1:
+                    w("\n")
+                w(_format_text_issue(number, issue))
+        else:
+            w("No issues found.\n")
 
     logger.info(f"Generated text report: {output_path}")
     return report_data
 
 
+def _format_text_issue(number: int, issue: Dict[str, Any]) -> str:
+    """Format one issue of the text report, ending with a newline."""
+    block = _TEXT_ISSUE_TEMPLATE.format(
+        number=number,
+        type=issue.get("type", "unknown"),
+        severity=issue.get("severity", "unknown"),
+        message=str(issue.get("message", "")).translate(_TEXT_LINE_BREAKS),
+    )
+    if issue.get("selector"):
+        block += f"\n  Selector: {issue['selector']}"
+    if "remediation_status" in issue:
+        block += f"\n  Status: {issue['remediation_status']}"
+    return block + "\n"
+
+
 def prepare_unified_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Prepare data for a unified report that combines audit and remediation information.
@@ -456,8 +599,7 @@ def prepare_unified_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
     if "by_page" in report_data:
         for page_num, page_data in report_data["by_page"].items():
             if "issues" in page_data and isinstance(page_data["issues"], list):
-                for issue in page_data["issues"]:
-                    all_issues.append(issue)
+                all_issues.extend(page_data["issues"])
                 logger.info(
                     f"Found {len(page_data['issues'])} issues in by_page[{page_num}]"
                 )
@@ -467,10 +609,11 @@ def prepare_unified_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
         for status, status_issues in report_data["by_status"].items():
             if isinstance(status_issues, list):
                 # Skip issues with circular references (common in audit reports)
-                clean_issues = []
-                for issue in status_issues:
-                    if isinstance(issue, dict) and not issue.get("$ref"):
-                        clean_issues.append(issue)
+                clean_issues = [
+                    issue
+                    for issue in status_issues
+                    if isinstance(issue, dict) and not issue.get("$ref")
+                ]
 
                 if clean_issues:
                     all_issues.extend(clean_issues)
@@ -481,10 +624,11 @@ def prepare_unified_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
     # Check for issues in the main 'issues' list
     if "issues" in report_data and isinstance(report_data["issues"], list):
         # Skip issues with circular references
-        clean_issues = []
-        for issue in report_data["issues"]:
-            if isinstance(issue, dict) and not issue.get("$ref"):
-                clean_issues.append(issue)
+        clean_issues = [
+            issue
+            for issue in report_data["issues"]
+            if isinstance(issue, dict) and not issue.get("$ref")
+        ]
 
         if clean_issues:
             all_issues.extend(clean_issues)
@@ -517,22 +661,29 @@ def prepare_unified_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
     seen_ids = set()
     unified_issues = []
 
+    # Bind the per-issue methods once; this loop runs over every collected issue
+    seen = seen_ids.add
+    keep = unified_issues.append
     for issue in all_issues:
-        # Create a unique ID for deduplication
-        issue_id = issue.get("id")
-        if not issue_id:
-            # Create a composite ID from type, severity, and selector/element if available
-            issue_type = issue.get("type", "unknown")
-            severity = issue.get("severity", "unknown")
-            selector = issue.get("selector", issue.get("element", ""))
-            issue_id = f"{issue_type}-{severity}-{selector}"
-
-        if issue_id not in seen_ids:
-            seen_ids.add(issue_id)
+        get = issue.get
+        # Create a unique key for deduplication
+        issue_key = get("id")
+        if not issue_key:
+            # Key on type, severity, and selector/element if available. A tuple
+            # hashes its parts directly; the string form is only built for
+            # issues that are kept and need an ID.
+            issue_key = (
+                get("type", "unknown"),
+                get("severity", "unknown"),
+                get("selector", get("element", "")),
+            )
+
+        if issue_key not in seen_ids:
+            seen(issue_key)
             # Give the issue an ID if it doesn't have one
             if "id" not in issue:
-                issue["id"] = issue_id
-            unified_issues.append(issue)
+                issue["id"] = "-".join(str(part) for part in issue_key)
+            keep(issue)
 
     # Update issues in unified data
     if unified_issues:
@@ -551,75 +702,83 @@ def prepare_unified_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
                 f"{issue.get('type', 'issue')}-{issue.get('severity', 'minor')}-{i+1}"
             )
 
+    # Remediation outcome totals, tallied in the counting pass below
+    remediated_total = 0
+    failed_total = 0
+
     # Ensure we have proper severity and issue type counts
     if unified_data.get("issues"):
         # Initialize count dictionaries
-        severity_counts = {"critical": 0, "major": 0, "minor": 0, "info": 0}
-        identified_issue_type_counts = {}
-        remediated_issue_type_counts = {}
-        compliant_issue_type_counts = {}
-        non_compliant_issue_type_counts = {}
+        severity_counts = Counter()
+        identified_issue_type_counts = Counter()
+        remediated_issue_type_counts = Counter()
+        compliant_issue_type_counts = Counter()
+        non_compliant_issue_type_counts = Counter()
 
         # Initialize severity breakdowns
-        severity_compliant_counts = {"critical": 0, "major": 0, "minor": 0, "info": 0}
-        severity_non_compliant_counts = {
-            "critical": 0,
-            "major": 0,
-            "minor": 0,
-            "info": 0,
-        }
+        severity_compliant_counts = Counter()
+        severity_non_compliant_counts = Counter()
 
         for issue in unified_data["issues"]:
             # Get issue properties
-            severity = issue.get("severity", "minor")
-            issue_type = issue.get("type", "unknown")
-
-            # Initialize counters for this issue type if needed
-            if issue_type not in identified_issue_type_counts:
-                identified_issue_type_counts[issue_type] = 0
-                remediated_issue_type_counts[issue_type] = 0
-                compliant_issue_type_counts[issue_type] = 0
-                non_compliant_issue_type_counts[issue_type] = 0
+            get = issue.get
+            severity = get("severity", "minor")
+            issue_type = get("type", "unknown")
 
             # Count all issues by type (identified)
             identified_issue_type_counts[issue_type] += 1
 
             # Count by severity
-            if severity in severity_counts:
-                severity_counts[severity] += 1
+            severity_counts[severity] += 1
 
             # Determine compliance status
-            status = issue.get("remediation_status", "")
-            compliance_status = issue.get("status", "")
+            status = get("remediation_status", "")
+            compliance_status = get("status", "")
+
+            if status == "remediated":
+                remediated_total += 1
+            elif status == "failed":
+                failed_total += 1
 
             # Issue is already compliant
             if compliance_status == "compliant" or issue_type.startswith("compliant-"):
                 compliant_issue_type_counts[issue_type] += 1
-                if severity in severity_compliant_counts:
-                    severity_compliant_counts[severity] += 1
+                severity_compliant_counts[severity] += 1
 
             # Issue was remediated to be compliant
             elif status == "remediated":
                 remediated_issue_type_counts[issue_type] += 1
-                if severity in severity_compliant_counts:
-                    severity_compliant_counts[severity] += 1
+                severity_compliant_counts[severity] += 1
 
             # Issue is non-compliant (needs remediation)
             else:
                 non_compliant_issue_type_counts[issue_type] += 1
-                if severity in severity_non_compliant_counts:
-                    severity_non_compliant_counts[severity] += 1
-
-        # Add the counts to the report data
-        unified_data["severity_counts"] = severity_counts
-        unified_data["severity_compliant_counts"] = severity_compliant_counts
-        unified_data["severity_non_compliant_counts"] = severity_non_compliant_counts
-        unified_data["identified_issue_type_counts"] = identified_issue_type_counts
-        unified_data["remediated_issue_type_counts"] = remediated_issue_type_counts
-        unified_data["compliant_issue_type_counts"] = compliant_issue_type_counts
-        unified_data["non_compliant_issue_type_counts"] = (
-            non_compliant_issue_type_counts
+                severity_non_compliant_counts[severity] += 1
+
+        # Add the counts to the report data. The severity breakdowns keep only
+        # the known severity levels, and every per-outcome breakdown lists each
+        # identified issue type, with zero where it has no issues
+        unified_data["severity_counts"] = {
+            s: severity_counts[s] for s in _SEVERITY_LEVELS
+        }
+        unified_data["severity_compliant_counts"] = {
+            s: severity_compliant_counts[s] for s in _SEVERITY_LEVELS
+        }
+        unified_data["severity_non_compliant_counts"] = {
+            s: severity_non_compliant_counts[s] for s in _SEVERITY_LEVELS
+        }
+        unified_data["identified_issue_type_counts"] = dict(
+            identified_issue_type_counts
         )
+        unified_data["remediated_issue_type_counts"] = {
+            t: remediated_issue_type_counts[t] for t in identified_issue_type_counts
+        }
+        unified_data["compliant_issue_type_counts"] = {
+            t: compliant_issue_type_counts[t] for t in identified_issue_type_counts
+        }
+        unified_data["non_compliant_issue_type_counts"] = {
+            t: non_compliant_issue_type_counts[t] for t in identified_issue_type_counts
+        }
 
         # Make sure total issues is set
         if "total_issues" not in unified_data:
@@ -633,18 +792,10 @@ def prepare_unified_report_data(report_data: Dict[str, Any]) -> Dict[str, Any]:
             unified_data["issues_processed"] = unified_data.get("total_issues", 0)
 
         if "issues_remediated" not in unified_data:
-            unified_data["issues_remediated"] = sum(
-                1
-                for issue in unified_data.get("issues", [])
-                if issue.get("remediation_status") == "remediated"
-            )
+            unified_data["issues_remediated"] = remediated_total
 
         if "issues_failed" not in unified_data:
-            unified_data["issues_failed"] = sum(
-                1
-                for issue in unified_data.get("issues", [])
-                if issue.get("remediation_status") == "failed"
-            )
+            unified_data["issues_failed"] = failed_total
 
     return unified_data
 
@@ -674,54 +825,53 @@ def generate_csv_report(
         # Create CSV writer
         csv_writer = writer(f)
 
-        # Add header row based on report type
+        # Add header row and pick the row layout based on report type
         if report_type == "accessibility":
-            csv_writer.writerow(
-                [
-                    "ID",
-                    "Type",
-                    "Severity",
-                    "Message",
-                    "Selector",
-                    "File Path",
-                    "Fix Available",
-                ]
-            )
+            csv_writer.writerow(_ACCESSIBILITY_CSV_HEADER)
+            csv_row = _accessibility_csv_row
         else:
             # For unified and remediation reports, use the same headers
-            csv_writer.writerow(
-                ["ID", "Type", "Severity", "Status", "Message", "Selector", "File Path"]
-            )
+            csv_writer.writerow(_REMEDIATION_CSV_HEADER)
+            csv_row = _remediation_csv_row
 
         # Add issues data
         issues = report_data.get("issues", []) or report_data.get("details", [])
-        for issue in issues:
-            if report_type == "accessibility":
-                csv_writer.writerow(
-                    [
-                        issue.get("id", ""),
-                        issue.get("type", "unknown"),
-                        issue.get("severity", "unknown"),
-                        issue.get("message", ""),
-                        issue.get("selector", ""),
-                        issue.get("file_path", "")
-                        or (issue.get("location", {}) or {}).get("file_path", ""),
-                        issue.get("fix_available", False),
-                    ]
-                )
-            else:
-                csv_writer.writerow(
-                    [
-                        issue.get("id", ""),
-                        issue.get("type", "unknown"),
-                        issue.get("severity", "unknown"),
-                        issue.get("remediation_status", "unknown"),
-                        issue.get("message", ""),
-                        issue.get("selector", ""),
-                        issue.get("file_path", "")
-                        or (issue.get("location", {}) or {}).get("file_path", ""),
-                    ]
-                )
+        csv_writer.writerows(map(csv_row, issues))
 
     logger.info(f"Generated CSV report: {output_path}")
     return report_data
+
+
+def _csv_file_path(issue: Dict[str, Any]) -> str:
+    """Return the issue's file path, falling back to its location."""
+    return issue.get("file_path", "") or (issue.get("location", {}) or {}).get(
+        "file_path", ""
+    )
+
+
+def _accessibility_csv_row(issue: Dict[str, Any]) -> List[Any]:
+    """Build one CSV row of an accessibility report."""
+    get = issue.get
+    return [
+        get("id", ""),
+        get("type", "unknown"),
+        get("severity", "unknown"),
+        get("message", ""),
+        get("selector", ""),
+        _csv_file_path(issue),
+        get("fix_available", False),
+    ]
+
+
+def _remediation_csv_row(issue: Dict[str, Any]) -> List[Any]:
+    """Build one CSV row of a remediation or unified report."""
+    get = issue.get
+    return [
+        get("id", ""),
+        get("type", "unknown"),
+        get("severity", "unknown"),
+        get("remediation_status", "unknown"),
+        get("message", ""),
+        get("selector", ""),
+        _csv_file_path(issue),
+    ]
@@ -206,16 +206,15 @@ class SessionUsageTracker:
             Exception: If there's an error saving to file
         """
         try:
-            # Get the usage data and convert to JSON
+            # Get the usage data
             usage_data = self.get_usage_data()
-            json_data = json.dumps(usage_data, indent=2)
             
             # Create directory if it doesn't exist
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            # Write to file
+            # Stream the JSON to the file rather than building it in memory first
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(json_data)
+                json.dump(usage_data, f, indent=2)
                 
             logger.info(f"Usage data saved to file: {output_path}")
             
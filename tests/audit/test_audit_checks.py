@@ -10,6 +10,7 @@ or that a compliant result is recorded. These lock in detection behavior across
 the check classes registered in the auditor.
 """
 
+from content_accessibility_utility_on_aws.audit.auditor import AccessibilityAuditor
 from tests.conftest import audit_html, has_issue_type, issues_of_type
 
 
@@ -92,6 +93,14 @@ def test_generic_heading_is_flagged():
     assert has_issue_type(report, "generic-heading")
 
 
+def test_auditor_headings_are_grouped_by_level():
+    auditor = AccessibilityAuditor(
+        html_content="<html><body><h2>a</h2><h1>b</h1><h3>c</h3><h2>d</h2></body></html>"
+    )
+    auditor.extract_elements()
+    assert [h.get_text() for h in auditor.headings] == ["b", "a", "d", "c"]
+
+
 # --- Document title (2.4.2) -------------------------------------------------
 
 
@@ -172,6 +181,17 @@ def test_form_input_missing_label_is_flagged():
     assert has_issue_type(report, "form-control-missing-label")
 
 
+def test_form_inputs_labelled_by_for_and_labelledby_are_not_flagged():
+    report = audit_html(
+        "<html><body><form>"
+        "<label for='email'>Email</label><input type='text' name='email' id='email'>"
+        "<span id='phone-label'>Phone</span>"
+        "<input type='text' name='phone' aria-labelledby='phone-label'>"
+        "</form></body></html>"
+    )
+    assert not has_issue_type(report, "form-control-missing-label")
+
+
 # --- Structure / landmarks --------------------------------------------------
 
 
@@ -3,9 +3,12 @@
 
 """Tests for report generation edge cases."""
 
+import gzip
+import json
 import os
 
 from content_accessibility_utility_on_aws.api import audit_html_accessibility
+from content_accessibility_utility_on_aws.utils import report_generator
 from content_accessibility_utility_on_aws.utils.report_generator import generate_report
 
 _HTML = "<html lang='en'><head><title>t</title></head><body><h1>Hi</h1></body></html>"
@@ -41,3 +44,85 @@ def test_audit_with_output_path_still_writes(tmp_path):
 
     audit_html_accessibility(str(html_file), options={}, output_path=str(out))
     assert os.path.exists(out)
+
+
+def test_text_report_keeps_multiline_message_on_one_line(tmp_path):
+    """Line breaks in a message must not split the issue's Message line."""
+    out = tmp_path / "report.txt"
+    report_data = {"issues": [{"type": "t", "message": "first\r\nsecond\nthird"}]}
+
+    generate_report(report_data, output_path=str(out), report_format="text")
+    assert "  Message: first  second third\n" in out.read_text(encoding="utf-8")
+
+
+def test_html_report_with_gz_suffix_is_compressed(tmp_path):
+    """An HTML report written to a .gz path is gzip-compressed."""
+    out = tmp_path / "report.html.gz"
+    report_data = {"issues": [{"type": "missing-alt-text", "severity": "major"}]}
+
+    generate_report(report_data, output_path=str(out), report_format="html")
+    with gzip.open(out, "rt", encoding="utf-8") as f:
+        assert "missing-alt-text" in f.read()
+
+
+def test_inline_css_report_omits_stylesheet_license_header(tmp_path):
+    """The stylesheet's license comment is not embedded in inline reports."""
+    out = tmp_path / "report.html"
+
+    generate_report({"issues": []}, output_path=str(out), report_format="html")
+    html = out.read_text(encoding="utf-8")
+    assert "--primary: #0078d4;" in html
+    assert "SPDX-License-Identifier" not in html.split("<style>", 1)[1]
+
+
+def test_linked_css_replaces_a_stale_stylesheet(tmp_path):
+    """A linked report refreshes an outdated stylesheet left by an older report."""
+    out = tmp_path / "report.html"
+    css = tmp_path / "unified_report.css"
+    css.write_text("/* stale */", encoding="utf-8")
+
+    generate_report(
+        {"issues": []}, output_path=str(out), report_format="html", inline_css=False
+    )
+    assert 'href="unified_report.css"' in out.read_text(encoding="utf-8")
+    assert "--primary: #0078d4;" in css.read_text(encoding="utf-8")
+
+
+def test_html_fallback_to_json_keeps_gz_output_compressed(tmp_path, monkeypatch):
+    """When HTML rendering fails, the JSON fallback at a .gz path is still gzip."""
+
+    def fail():
+        raise RuntimeError("template unavailable")
+
+    monkeypatch.setattr(report_generator, "_get_report_template", fail)
+    out = tmp_path / "report.html.gz"
+
+    generate_report({"issues": []}, output_path=str(out), report_format="html")
+    with gzip.open(out, "rt", encoding="utf-8") as f:
+        assert json.load(f)["issues"] == []
+
+
+def test_json_report_indent_none_is_compact(tmp_path):
+    """indent=None writes compact JSON; the default is indented."""
+    report_data = {"issues": [{"type": "t", "severity": "minor"}]}
+    indented = tmp_path / "indented.json"
+    compact = tmp_path / "compact.json"
+
+    report_generator.generate_json_report(report_data, str(indented))
+    report_generator.generate_json_report(report_data, str(compact), indent=None)
+    assert indented.read_text(encoding="utf-8").startswith('{\n  "issues": [')
+    assert compact.read_text(encoding="utf-8").startswith('{"issues":[{"type":"t",')
+
+
+def test_template_bytecode_cache_directory_is_configurable(tmp_path, monkeypatch):
+    """A11Y_REPORT_TEMPLATE_CACHE picks the cache directory or turns it off."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("A11Y_REPORT_TEMPLATE_CACHE", str(cache_dir))
+    monkeypatch.setattr(report_generator, "_report_template", None)
+    generate_report({"issues": []}, str(tmp_path / "a.html"), report_format="html")
+    assert any(cache_dir.iterdir())
+
+    monkeypatch.setenv("A11Y_REPORT_TEMPLATE_CACHE", "off")
+    monkeypatch.setattr(report_generator, "_report_template", None)
+    generate_report({"issues": []}, str(tmp_path / "b.html"), report_format="html")
+    assert report_generator._report_template.environment.bytecode_cache is None
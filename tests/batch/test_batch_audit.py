@@ -0,0 +1,84 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offline tests for the batch directory audit (batch.audit.process_html_directory).
+
+The S3 listing, per-file audit, upload and job-status touchpoints are
+monkeypatched, so no AWS access is needed. They lock in that documents are
+audited in listing order with per-file job IDs, and that a failing file is
+recorded without stopping the rest.
+"""
+
+import json
+
+import content_accessibility_utility_on_aws.batch.audit as batch_audit
+
+
+class _Paginator:
+    def __init__(self, keys):
+        self._keys = keys
+
+    def paginate(self, **kwargs):
+        return [{"Contents": [{"Key": key} for key in self._keys]}]
+
+
+class _S3:
+    def __init__(self, keys):
+        self._keys = keys
+
+    def get_paginator(self, name):
+        return _Paginator(self._keys)
+
+
+def test_directory_audit_keeps_listing_order_and_records_failures(monkeypatch):
+    keys = ["docs/a.html", "docs/notes.txt", "docs/b.HTML", "docs/c.html"]
+    monkeypatch.setattr(batch_audit, "s3_client", _S3(keys))
+    monkeypatch.setattr(batch_audit, "update_job_status", lambda **kwargs: None)
+
+    calls = []
+
+    def fake_audit(job_id, source_bucket, source_key, destination_bucket, options):
+        calls.append((job_id, source_key))
+        if source_key == "docs/b.HTML":
+            raise ValueError("unreadable")
+        return {
+            "source_key": source_key,
+            "status": batch_audit.STATUS_COMPLETED,
+            "total_issues": 2,
+            "severity_counts": {"critical": 1, "minor": 1},
+        }
+
+    monkeypatch.setattr(batch_audit, "process_html_document", fake_audit)
+
+    uploaded = {}
+
+    def fake_upload(local_path, bucket, key, metadata=None):
+        with open(local_path, encoding="utf-8") as f:
+            uploaded[key] = json.load(f)
+
+    monkeypatch.setattr(batch_audit, "upload_to_s3", fake_upload)
+
+    result = batch_audit.process_html_directory("job", "in", "docs/", "out")
+
+    assert calls == [
+        ("job_0", "docs/a.html"),
+        ("job_1", "docs/b.HTML"),
+        ("job_2", "docs/c.html"),
+    ]
+    report = uploaded["audit/job_combined_audit.json"]
+    assert [r["source_key"] for r in report["file_results"]] == [
+        "docs/a.html",
+        "docs/b.HTML",
+        "docs/c.html",
+    ]
+    assert report["file_results"][1]["status"] == batch_audit.STATUS_FAILED
+    assert report["files_succeeded"] == 2
+    assert report["files_failed"] == 1
+    assert report["summary"]["total_issues"] == 4
+    assert report["summary"]["severity_counts"] == {
+        "critical": 2,
+        "major": 0,
+        "minor": 2,
+    }
+    assert result["status"] == batch_audit.STATUS_COMPLETED
@@ -13,6 +13,7 @@ from bs4 import BeautifulSoup
 
 from content_accessibility_utility_on_aws.utils.color_contrast import (
     AA_NORMAL_TEXT,
+    BLACK_WHITE_CROSSOVER,
     adjust_for_contrast,
     contrast_ratio,
     parse_color,
@@ -46,6 +47,17 @@ def test_relative_luminance_monotonic():
     assert relative_luminance((128, 128, 128)) < relative_luminance((255, 255, 255))
 
 
+def test_black_white_crossover_balances_ratios():
+    # At the crossover luminance black and white give the same contrast ratio.
+    against_white = 1.05 / (BLACK_WHITE_CROSSOVER + 0.05)
+    against_black = (BLACK_WHITE_CROSSOVER + 0.05) / 0.05
+    assert abs(against_white - against_black) < 1e-9
+    # #777777 sits just above it: black text contrasts better than white.
+    grey = (0x77, 0x77, 0x77)
+    assert contrast_ratio((0, 0, 0), grey) > contrast_ratio((255, 255, 255), grey)
+    assert relative_luminance(grey) > BLACK_WHITE_CROSSOVER
+
+
 def test_adjust_for_contrast_light_background():
     fg, bg = (153, 153, 153), (255, 255, 255)  # #999 on white ~ 2.85:1
     assert contrast_ratio(fg, bg) < AA_NORMAL_TEXT
@@ -0,0 +1,102 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for ElementIndex ordering: BDA elements are indexed per page in on-page
+position order (top, then left), and the document order runs by first page and
+then position. Ties keep the input order.
+"""
+
+from content_accessibility_utility_on_aws.remediate.bda_integration.element_index import (
+    ElementIndex,
+)
+
+
+def _el(element_id, pages, top, left):
+    return {
+        "id": element_id,
+        "page_indices": pages,
+        "bounding_box": {"top": top, "left": left},
+    }
+
+
+def _elements():
+    return [
+        _el("p1-bottom", [1], 0.9, 0.1),
+        _el("p0-right", [0], 0.2, 0.8),
+        _el("p0-left", [0], 0.2, 0.1),
+        _el("spans-0-1", [0, 1], 0.5, 0.5),
+        _el("p0-top", [0], 0.1, 0.5),
+        _el("p1-top", [1], 0.1, 0.1),
+    ]
+
+
+def test_page_buckets_are_in_position_order():
+    index = ElementIndex(_elements())
+
+    assert [e["id"] for e in index.get_page_elements(0)] == [
+        "p0-top",
+        "p0-left",
+        "p0-right",
+        "spans-0-1",
+    ]
+    assert [e["id"] for e in index.get_page_elements(1)] == [
+        "p1-top",
+        "spans-0-1",
+        "p1-bottom",
+    ]
+
+
+def test_document_order_is_first_page_then_position():
+    index = ElementIndex(_elements())
+
+    assert index.element_order == [
+        "p0-top",
+        "p0-left",
+        "p0-right",
+        "spans-0-1",
+        "p1-top",
+        "p1-bottom",
+    ]
+
+
+def test_equal_positions_keep_input_order():
+    index = ElementIndex([_el("a", [0], 0.1, 0.1), _el("b", [0], 0.1, 0.1)])
+
+    assert index.element_order == ["a", "b"]
+    assert [e["id"] for e in index.get_page_elements(0)] == ["a", "b"]
+
+
+def _img(element_id, page, top, src):
+    element = _el(element_id, [page], top, 0.1)
+    element["representation"] = {"html": f'<img src="{src}" alt="">'}
+    return element
+
+
+def test_issue_ordinal_matches_input_order_on_page():
+    # Input order differs from position order: the path ordinal refers to the
+    # element's order in the source data, not its position on the page.
+    elements = [
+        _img("img-a", 2, 0.8, "a.png"),
+        _img("img-b", 2, 0.1, "b.png"),
+        _img("other-page", 3, 0.1, "c.png"),
+    ]
+    issue = {
+        "type": "missing-alt-text",
+        "location": {"page_number": 2, "path": "div#page-2 > img:nth-of-type(1)"},
+    }
+    index = ElementIndex(elements, issues=[issue])
+
+    assert index.get_issues_by_element_id("img-a") == [issue]
+    assert index.get_pages_with_issues() == [2]
+
+
+def test_counting_elements_with_issues_leaves_elements_untouched():
+    issue = {"type": "missing-alt-text", "element_id": "img-a"}
+    elements = [_img("img-a", 0, 0.1, "a.png"), _img("img-b", 0, 0.2, "b.png")]
+    index = ElementIndex(elements)
+    index.add_issue(issue)
+
+    assert index.count_elements_with_issues() == len(index.get_elements_with_issues())
+    assert index.count_elements_with_issues() == 1
+    assert "accessibility_issues" not in index.get_element_by_id("img-a")
@@ -0,0 +1,153 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offline tests for the file-level remediation API (remediate.api).
+
+Remediation runs with ``disable_ai=True``; image copying is monkeypatched where
+a test needs it to fail.
+"""
+
+import os
+
+from content_accessibility_utility_on_aws.remediate import api as remediate_api
+
+_PAGE = "<html><head><title>t</title></head><body><h1>Page</h1></body></html>"
+
+
+def _language_issue(**where):
+    return {
+        "type": "missing-document-language",
+        "remediation_status": "needs_remediation",
+        **where,
+    }
+
+
+def _fail_after_remediation(exc):
+    """copy_images_to_output stand-in that fails on each post-remediation copy."""
+    calls = []
+
+    def copy(src_dir, dest_dir, soup):
+        calls.append(dest_dir)
+        if len(calls) % 2 == 0:
+            raise exc
+        return {}
+
+    return copy
+
+
+def test_single_page_is_saved_when_image_copy_fails(tmp_path, monkeypatch):
+    html_path = tmp_path / "page.html"
+    html_path.write_text(_PAGE, encoding="utf-8")
+    image_dir = tmp_path / "images"
+    image_dir.mkdir()
+    output_path = tmp_path / "out" / "page.html"
+    monkeypatch.setattr(
+        remediate_api,
+        "copy_images_to_output",
+        _fail_after_remediation(OSError("disk full")),
+    )
+
+    remediate_api.remediate_html_accessibility(
+        str(html_path),
+        audit_report={"issues": [_language_issue()]},
+        options={"disable_ai": True},
+        output_path=str(output_path),
+        image_dir=str(image_dir),
+    )
+    assert 'lang="en"' in output_path.read_text(encoding="utf-8")
+
+
+def test_multi_page_failure_counts_each_file_once(tmp_path, monkeypatch):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    for name in ("page-1.html", "page-2.html"):
+        (pages / name).write_text(_PAGE, encoding="utf-8")
+    image_dir = tmp_path / "images"
+    image_dir.mkdir()
+    monkeypatch.setattr(
+        remediate_api,
+        "copy_images_to_output",
+        _fail_after_remediation(RuntimeError("unexpected")),
+    )
+
+    result = remediate_api.remediate_html_accessibility(
+        str(pages),
+        audit_report={
+            "issues": [
+                _language_issue(file_name="page-1.html"),
+                _language_issue(file_name="page-2.html"),
+            ]
+        },
+        options={"disable_ai": True},
+        output_path=str(tmp_path / "out"),
+        image_dir=str(image_dir),
+    )
+    # Both files fail after remediation; each issue is counted exactly once
+    assert result["issues_processed"] == 2
+    assert result["issues_failed"] == 2
+    assert result["file_results"] == []
+
+
+def _record_file_issues(monkeypatch):
+    """Replace per-file remediation with a recorder of the issues each file gets."""
+    received = {}
+
+    def remediate_file(html_path, issues, options, image_dir=None, soup=None):
+        received[os.path.basename(html_path)] = [issue["id"] for issue in issues]
+        return {"issues_processed": len(issues), "issues_remediated": 0}
+
+    monkeypatch.setattr(remediate_api, "_remediate_html_file", remediate_file)
+    return received
+
+
+def _write_pages(directory, names):
+    directory.mkdir()
+    for name in names:
+        (directory / name).write_text(_PAGE, encoding="utf-8")
+    return sorted(str(directory / name) for name in names)
+
+
+def test_multi_page_matches_issues_to_files(tmp_path, monkeypatch):
+    """Issues match by path, basename, abspath, file name or page number.
+
+    Issues without location info go to the first file, each file keeps the
+    audit order, and malformed locations match no file instead of failing.
+    """
+    first, _, third = _write_pages(
+        tmp_path / "pages", ["page-1.html", "page-2.html", "page-3.html"]
+    )
+    # List the pages in name order so page-1.html is the first file
+    walk = os.walk
+    monkeypatch.setattr(
+        os,
+        "walk",
+        lambda top: ((root, dirs, sorted(files)) for root, dirs, files in walk(top)),
+    )
+    received = _record_file_issues(monkeypatch)
+    issues = [
+        {"id": "unlocated"},
+        {"id": "page", "location": {"page_number": 2}},
+        {"id": "full-path", "file_path": first},
+        {"id": "basename", "location": {"file_path": "elsewhere/page-2.html"}},
+        {"id": "file-name", "file_name": "page-3.html"},
+        {"id": "abspath", "file_path": os.path.relpath(third)},
+        {"id": "unlocated-2", "location": {"path": "html > body"}},
+        {"id": "malformed-page", "page_number": [1], "location": "page-1"},
+        {"id": "malformed-path", "file_path": ["page-1.html"]},
+    ]
+    for issue in issues:
+        issue["remediation_status"] = "needs_remediation"
+
+    remediate_api.remediate_html_accessibility(
+        str(tmp_path / "pages"),
+        audit_report={"issues": issues},
+        options={"disable_ai": True},
+        output_path=str(tmp_path / "out"),
+        image_dir=str(tmp_path / "no-images"),
+    )
+    assert received == {
+        "page-1.html": ["unlocated", "full-path", "unlocated-2"],
+        "page-2.html": ["page", "basename"],
+        "page-3.html": ["file-name", "abspath"],
+    }
@@ -117,6 +117,38 @@ def test_color_contrast_dispatch_passes_client_arg():
     remediate_insufficient_color_contrast(soup, issue, None)
 
 
+def test_color_contrast_rewrites_color_without_touching_background():
+    from content_accessibility_utility_on_aws.remediate.remediation_strategies.color_contrast_remediation import (
+        remediate_insufficient_color_contrast,
+    )
+
+    soup = BeautifulSoup(
+        "<html><body><p style='background-color:#111;color:#222;margin:0'>Dim</p></body></html>",
+        "html.parser",
+    )
+    issue = make_issue("insufficient-color-contrast", path="html > body > p", element="<p>Dim</p>")
+    remediate_insufficient_color_contrast(soup, issue, None)
+    assert soup.p["style"] == "background-color: #111; color: #FFFFFF; margin: 0"
+
+
+def test_color_contrast_keeps_data_url_background_image_intact():
+    from content_accessibility_utility_on_aws.remediate.remediation_strategies.color_contrast_remediation import (
+        remediate_insufficient_color_contrast,
+    )
+
+    image = 'url("data:image/png;base64,iVBORw0KGgo=")'
+    soup = BeautifulSoup(
+        f"<html><body><p style='background-image: {image}; "
+        "background-color: #000; color: #111'>Dim</p></body></html>",
+        "html.parser",
+    )
+    issue = make_issue("insufficient-color-contrast", path="html > body > p", element="<p>Dim</p>")
+    remediate_insufficient_color_contrast(soup, issue, None)
+    assert soup.p["style"] == (
+        f"background-image: {image}; background-color: #000; color: #FFFFFF"
+    )
+
+
 # --- Document structure -----------------------------------------------------
 
 
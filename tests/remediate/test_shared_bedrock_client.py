@@ -0,0 +1,50 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates.
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Tests for the process-wide BedrockClient factory (get_shared_bedrock_client).
+
+Remediation managers and the default alt text path both take their client from
+the one factory, so a model/profile pair builds a single client. BedrockClient
+is replaced by a stub so no AWS session is created.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from content_accessibility_utility_on_aws.remediate.services import bedrock_client
+from content_accessibility_utility_on_aws.remediate.remediation_manager import (
+    RemediationManager,
+)
+from content_accessibility_utility_on_aws.utils.constants import DEFAULT_MODEL_ID
+
+
+class _StubClient:
+    def __init__(self, model_id, profile):
+        self.model_id = model_id
+        self.profile = profile
+
+
+@pytest.fixture
+def stub_clients(monkeypatch):
+    monkeypatch.setattr(bedrock_client, "BedrockClient", _StubClient)
+    bedrock_client.get_shared_bedrock_client.cache_clear()
+    yield
+    bedrock_client.get_shared_bedrock_client.cache_clear()
+
+
+def test_one_client_per_model_and_profile(stub_clients):
+    first = bedrock_client.get_shared_bedrock_client("model-a", None)
+
+    assert bedrock_client.get_shared_bedrock_client("model-a", None) is first
+    assert bedrock_client.get_shared_bedrock_client("model-a", "dev") is not first
+    assert bedrock_client.get_shared_bedrock_client("model-b", None) is not first
+
+
+def test_managers_share_the_default_client(stub_clients):
+    soup = BeautifulSoup("<p>x</p>", "html.parser")
+    first = RemediationManager(soup).bedrock_client
+    second = RemediationManager(soup).bedrock_client
+
+    assert first is second
+    assert first is bedrock_client.get_shared_bedrock_client(DEFAULT_MODEL_ID, None)
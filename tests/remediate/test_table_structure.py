@@ -58,6 +58,19 @@ def test_infer_scope_confidence_flags():
     assert infer_scope_with_confidence(table, ths["North"]) == ("row", True)
 
 
+def test_infer_scope_locates_identical_cells_by_identity():
+    # Two equal-looking headers in one row: the second is an interior cell, not
+    # the row's first cell, so it must not be read as a confident row header.
+    soup = BeautifulSoup(
+        "<table><tr><th>A</th><th>B</th></tr><tr><th>X</th><th>X</th></tr></table>",
+        "html.parser",
+    )
+    first, second = soup.find_all("tr")[1].find_all("th")
+    table = soup.find("table")
+    assert infer_scope_with_confidence(table, first) == ("row", True)
+    assert infer_scope_with_confidence(table, second)[1] is False
+
+
 def test_headers_reference_correct_row_and_column():
     soup = BeautifulSoup(MATRIX_TABLE, "html.parser")
     remediate_table_headers_id(
@@ -352,3 +352,92 @@ def test_bundle_dest_rejects_traversal(tmp_path):
     ]:
         with pytest.raises(ValueError):
             pipe._bundle_dest(work, "html/doc/", bad)
+
+
+# --- open-issue tally and the re-audit shortcut ------------------------------
+
+def test_tally_open_issues_skips_closed_statuses():
+    audit = _audit(
+        {"wcag_criterion": "1.1.1", "remediation_status": "needs_remediation"},
+        {"wcag_criterion": "1.1.1"},
+        {"remediation_status": "needs_remediation"},
+        {"wcag_criterion": "1.4.3", "remediation_status": "compliant"},
+        {"wcag_criterion": "1.4.3", "remediation_status": "remediated"},
+        {"wcag_criterion": "2.4.7", "remediation_status": "resolved"},
+    )
+    assert pipe._tally_open_issues(audit) == (3, {"1.1.1": 2, "unknown": 1})
+
+
+def test_tally_open_issues_prefers_summary_needs_remediation():
+    audit = _audit({"wcag_criterion": "1.1.1"}, {"wcag_criterion": "2.4.2"})
+    audit["summary"] = {"needs_remediation": 5}
+    assert pipe._tally_open_issues(audit) == (5, {"1.1.1": 1, "2.4.2": 1})
+
+    audit["summary"] = {"needs_remediation": None}
+    assert pipe._tally_open_issues(audit)[0] == 0
+
+    audit["summary"] = {"total_issues": 9}
+    assert pipe._tally_open_issues(audit)[0] == 2
+
+
+def _stub_audit_stage(monkeypatch, audit_result, agent_pages):
+    """Stub every AWS/browser touchpoint of _run_audit.
+
+    Returns the list of re-audit targets and the list of job status details.
+    """
+    def materialize(bucket, key, work):
+        target = os.path.join(work, "doc.html")
+        with open(target, "w", encoding="utf-8") as fh:
+            fh.write("<html><body>x</body></html>")
+        return target, False, "doc"
+
+    class _S3:
+        def upload_file(self, *args):
+            pass
+
+    statuses = []
+    monkeypatch.setattr(
+        pipe, "update_job_status", lambda job_id, status, stage, detail: statuses.append(detail)
+    )
+    monkeypatch.setattr(pipe, "_materialize_html_input", materialize)
+    monkeypatch.setattr(pipe, "audit_html_accessibility", lambda **k: audit_result)
+    monkeypatch.setattr(pipe, "remediate_html_accessibility", lambda **k: {})
+    monkeypatch.setattr(pipe, "_run_agent_on_single_page", lambda *a: agent_pages)
+    monkeypatch.setattr(pipe, "_publish_tree", lambda *a: [])
+    monkeypatch.setattr(pipe, "s3_client", _S3())
+    reaudits = []
+
+    def reaudit(target, work, options, before, output_path):
+        reaudits.append(target)
+        return pipe._gap_summary(before, _audit())
+
+    monkeypatch.setattr(pipe, "_reaudit_final", reaudit)
+    return reaudits, statuses
+
+
+def test_reaudit_skipped_when_nothing_open_and_no_agent_pages(monkeypatch):
+    clean = _audit({"wcag_criterion": "1.1.1", "remediation_status": "compliant"})
+    reaudits, statuses = _stub_audit_stage(monkeypatch, clean, agent_pages=0)
+
+    result = pipe._run_audit("j1", "b", "html/doc.html", "out", {})
+    assert reaudits == []
+    assert result["status"] == "completed"
+    # The gap is built from the before report alone: nothing open either side
+    final = statuses[-1]
+    assert (final["issues_before"], final["issues_after"], final["issues_resolved"]) == (0, 0, 0)
+
+
+def test_reaudit_runs_when_issues_are_open(monkeypatch):
+    flagged = _audit({"wcag_criterion": "1.1.1", "remediation_status": "needs_remediation"})
+    reaudits, _ = _stub_audit_stage(monkeypatch, flagged, agent_pages=0)
+
+    pipe._run_audit("j1", "b", "html/doc.html", "out", {})
+    assert len(reaudits) == 1
+
+
+def test_reaudit_runs_when_agent_changed_pages(monkeypatch):
+    clean = _audit({"wcag_criterion": "1.1.1", "remediation_status": "compliant"})
+    reaudits, _ = _stub_audit_stage(monkeypatch, clean, agent_pages=1)
+
+    pipe._run_audit("j1", "b", "html/doc.html", "out", {})
+    assert len(reaudits) == 1
@@ -41,6 +41,22 @@ def test_verify_records_failure_when_fix_not_applied(focus_fail_probe_result):
     assert session.is_verified("button#go", "2.4.7") is False
 
 
+def test_probe_page_reuses_result_until_html_changes(focus_fail_probe_result):
+    probe = FakeProbe(focus_fail_probe_result)
+    renders = []
+    render = probe.render_and_probe
+    probe.render_and_probe = lambda html: renders.append(html) or render(html)
+    session = AgentSession(probe=probe, html=FOCUS_FAIL_HTML)
+
+    first = session.probe_page()
+    assert session.probe_page() == first
+    assert len(renders) == 1
+
+    session.apply_fix("button#go", "focus-not-visible")
+    session.probe_page()
+    assert len(renders) == 2
+
+
 def _fire_before_tool(hook, name, tool_input):
     """Build and dispatch a BeforeToolCallEvent through the hook; return it."""
     from strands.hooks import BeforeToolCallEvent, HookRegistry